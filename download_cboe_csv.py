@@ -2,6 +2,17 @@ import os
 
 import requests
 
+from market_data.utils.http import make_session
+
+_CHUNK_SIZE = 64 * 1024
+
+# Some websites may block requests without a valid User-Agent.
+SESSION = make_session(
+  headers={
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
+  }
+)
+
 
 def download_weeklies():
   download_cboe_options_symbols(
@@ -35,20 +46,18 @@ def download_cboe_options_symbols(url, filename="cboe_options_symbols.csv"):
   print(f"Attempting to download from: {url}")
 
   try:
-    # Some websites may block requests without a valid User-Agent.
-    headers = {
-      "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36"
-    }
     # It's good practice to set a timeout for requests.
-    response = requests.get(url, timeout=30, headers=headers)
-
-    # Raise an exception for bad status codes (e.g., 404, 500)
-    response.raise_for_status()
+    # Stream the body so the file is written in fixed-size chunks instead of
+    # being held in memory in full.
+    with SESSION.get(url, timeout=30, stream=True) as response:
+      # Raise an exception for bad status codes (e.g., 404, 500)
+      response.raise_for_status()
 
-    output_path = os.path.abspath(filename)
+      output_path = os.path.abspath(filename)
 
-    with open(output_path, "wb") as f:
-      f.write(response.content)
+      with open(output_path, "wb") as f:
+        for chunk in response.iter_content(chunk_size=_CHUNK_SIZE):
+          f.write(chunk)
 
     print(f"\nSuccessfully downloaded and saved to: {output_path}")
 
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import importlib
 import os
 from dataclasses import dataclass
@@ -46,25 +47,40 @@ _PROVIDERS = {
 
 class ProviderFactory:
   @staticmethod
+  @functools.cache
   def _import_from_string(path: str) -> type[object]:
-    """Helper to dynamically import a class from a string path."""
+    """Helper to dynamically import a class from a string path (memoized)."""
     module_name, class_name = path.rsplit(".", 1)
     module = importlib.import_module(module_name)
     return getattr(module, class_name)
 
   def create(self, provider_name: str) -> object:
-    """Creates a provider instance based on its registered name."""
+    """Returns the provider instance registered under the given name.
+
+    Instances are cached per (provider, API key) so SDK clients and their
+    connection pools are reused by every fetch within the process.
+    """
     metadata = _PROVIDERS.get(provider_name)
     if not metadata:
       raise ValueError(f"Provider '{provider_name}' not found.")
 
-    provider_class = self._import_from_string(metadata.class_path)
-
-    constructor_kwargs = {}
+    api_key = None
     if metadata.api_key_env_var:
       api_key = os.getenv(metadata.api_key_env_var)
       if not api_key:
         raise ValueError(f"Missing required env var '{metadata.api_key_env_var}'")
+
+    return self._create_cached(provider_name, api_key)
+
+  @staticmethod
+  @functools.lru_cache(maxsize=8)
+  def _create_cached(provider_name: str, api_key: str | None) -> object:
+    """Instantiates a provider; memoized so each key gets a single instance."""
+    metadata = _PROVIDERS[provider_name]
+    provider_class = ProviderFactory._import_from_string(metadata.class_path)
+
+    constructor_kwargs = {}
+    if api_key is not None:
       constructor_kwargs["api_key"] = api_key
 
     return provider_class(**constructor_kwargs)
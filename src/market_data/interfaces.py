@@ -1,7 +1,10 @@
+from __future__ import annotations
+
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-from market_data.models import Candle, Ticker
+if TYPE_CHECKING:
+  from market_data.models import Candle, Ticker
 
 
 class TickersFetcher(ABC):
@@ -36,6 +39,22 @@ class CandlesFetcher(ABC):
     pass
 
 
+class BatchCandlesFetcher(ABC):
+  """Abstract base class for fetching candles for many tickers in one call."""
+
+  @abstractmethod
+  def get_candles_batch(self, **kwargs: Any) -> dict[str, list[Candle]]:
+    """Fetches candle (OHLCV) data for several tickers at once.
+
+    Args:
+      **kwargs: Provider-specific arguments (e.g., tickers, from_date, to_date)
+
+    Returns:
+      Mapping of ticker symbol to its list of Candle objects
+    """
+    pass
+
+
 class OptionableFetcher(ABC):
   """Abstract base class for optionable ticker fetching functionality."""
 
@@ -3,19 +3,31 @@ from __future__ import annotations
 import functools
 import logging
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import date
+from typing import TYPE_CHECKING
 
 import click
 from dotenv import load_dotenv
 
 from market_data.factory import ProviderFactory
 from market_data.interfaces import (
+  BatchCandlesFetcher,
   CandlesFetcher,
   MetadataFetcher,
   OptionableFetcher,
   TickersFetcher,
 )
-from market_data.utils.savers import save_to_csv
+from market_data.utils.ratelimit import TokenBucket
+from market_data.utils.savers import (
+  save_models_to_csv,
+  save_models_to_parquet,
+  save_to_csv,
+)
+
+if TYPE_CHECKING:
+  from market_data.models import Ticker
 
 # --- Setup ---
 logging.basicConfig(
@@ -24,6 +36,21 @@ logging.basicConfig(
   stream=sys.stdout,
 )
 
+# Writers for list-of-model outputs, keyed by --format (also the file extension).
+_MODEL_SAVERS = {"csv": save_models_to_csv, "parquet": save_models_to_parquet}
+
+# Providers whose OptionableFetcher filters by the `type` kwarg.
+_OPTION_TYPE_PROVIDERS = frozenset({"cboe"})
+
+_FORMAT_OPTION = click.option(
+  "--format",
+  "output_format",
+  type=click.Choice(list(_MODEL_SAVERS)),
+  default="csv",
+  show_default=True,
+  help="Output file format; parquet requires the 'fast' extra (pyarrow).",
+)
+
 # --- Error Handling Decorator ---
 
 
@@ -44,14 +71,24 @@ def cli_error_handler(func):
   return wrapper
 
 
-# --- Private Helper ---
+# --- Private Helpers ---
 
 
-def _get_fetcher(provider_name: str, interface_class: type) -> callable:
-  """Helper to create a provider and get a specific fetcher component."""
-  factory = ProviderFactory()
-  data_provider = factory.create(provider_name)
+@functools.cache
+def _load_env() -> None:
+  """Loads .env into the environment once per process."""
+  load_dotenv()
+
 
+def _get_provider(provider_name: str) -> object:
+  """Returns the (cached) provider instance registered under the given name."""
+  return ProviderFactory().create(provider_name)
+
+
+def _resolve(
+  provider_name: str, data_provider: object, interface_class: type
+) -> callable:
+  """Returns a provider's fetcher for an interface, or raises if unsupported."""
   if not data_provider.supports(interface_class):
     capability_name = interface_class.__name__.replace("Fetcher", "")
     raise TypeError(
@@ -61,13 +98,63 @@ def _get_fetcher(provider_name: str, interface_class: type) -> callable:
   return data_provider.get_fetcher(interface_class)
 
 
+def _get_fetcher(provider_name: str, interface_class: type) -> callable:
+  """Helper to create a provider and get a specific fetcher component."""
+  return _resolve(provider_name, _get_provider(provider_name), interface_class)
+
+
+def _split_ticker_args(values: tuple[str, ...]) -> list[str]:
+  """Normalizes repeated and/or comma-separated ticker options.
+
+  Returns upper-cased symbols in first-seen order with blanks and duplicates
+  removed.
+  """
+  symbols = (
+    segment.strip().upper() for value in values for segment in value.split(",")
+  )
+  return list(dict.fromkeys(symbol for symbol in symbols if symbol))
+
+
+def _enrich_rows(
+  base_map: dict[str, dict], metadata_map: dict[str, Ticker]
+) -> Iterator[dict]:
+  """Yields each base row overlaid with the non-null fields of its metadata."""
+  for symbol, base in base_map.items():
+    enriched_meta = metadata_map.get(symbol)
+    if enriched_meta is None:
+      # Rows are only read by the CSV writer, so the base needs no copy.
+      yield base
+      continue
+    yield base | {
+      key: value for key, value in enriched_meta.__dict__.items() if value is not None
+    }
+
+
+def _save_candles(
+  symbol: str,
+  candles: list,
+  provider: str,
+  from_date: str,
+  to_date: str,
+  output_format: str = "csv",
+) -> None:
+  """Saves one ticker's candles to its own output file."""
+  if not candles:
+    logging.warning(f"No candle data was fetched for {symbol}.")
+    return
+
+  filename = f"{provider}_{symbol}_candles_{from_date}_to_{to_date}.{output_format}"
+  logging.info(f"Saving {len(candles)} candles to {filename}...")
+  _MODEL_SAVERS[output_format](candles, filename)
+
+
 # --- CLI Commands ---
 
 
 @click.group()
 def cli():
   """A CLI for fetching financial market data."""
-  load_dotenv()
+  _load_env()
 
 
 @cli.command()
@@ -77,53 +164,139 @@ def cli():
 @click.option(
   "--exchange", help="The exchange to filter by (for providers that support it)."
 )
+@click.option(
+  "--cache/--no-cache",
+  default=True,
+  show_default=True,
+  help="Reuse fresh results from the on-disk cache.",
+)
+@_FORMAT_OPTION
 @cli_error_handler  # Apply the decorator
-def fetch_tickers(provider, exchange):
+def fetch_tickers(provider, exchange, cache, output_format):
   """Fetch a list of tickers from a provider."""
   logging.info(f"Executing 'fetch-tickers' for provider: {provider}")
 
   get_tickers_func = _get_fetcher(provider, TickersFetcher)
-  tickers = get_tickers_func(exchange=exchange)
+  tickers = get_tickers_func(exchange=exchange, cache=cache)
 
   if not tickers:
     logging.warning("No tickers were fetched.")
     return
 
-  filename = f"{provider}_{exchange or 'all'}_tickers.csv"
+  filename = f"{provider}_{exchange or 'all'}_tickers.{output_format}"
   logging.info(f"Saving {len(tickers)} tickers to {filename}...")
-  save_to_csv([t.model_dump() for t in tickers], filename)
+  _MODEL_SAVERS[output_format](tickers, filename)
 
 
 @cli.command()
 @click.option("--provider", required=True, help="The data provider to use.")
-@click.option("--ticker", required=True, help="The stock ticker symbol (e.g., AAPL).")
+@click.option(
+  "--ticker",
+  "tickers",
+  required=True,
+  multiple=True,
+  help="Stock ticker symbol(s) (e.g., AAPL). Repeat or comma-separate for several.",
+)
 @click.option("--from-date", required=True, help="Start date in YYYY-MM-DD format.")
 @click.option(
   "--to-date", default=date.today().isoformat(), help="End date (YYYY-MM-DD)."
 )
 @click.option("--timespan", default="day", help="e.g., day, hour, minute.")
 @click.option("--multiplier", type=int, default=1, help="Multiplier for the timespan.")
+@click.option(
+  "--cache/--no-cache",
+  default=True,
+  show_default=True,
+  help="Reuse fresh results from the on-disk cache.",
+)
+@click.option(
+  "--max-workers",
+  type=int,
+  default=8,
+  show_default=True,
+  help="Maximum number of tickers to fetch concurrently.",
+)
+@click.option(
+  "--delay",
+  type=float,
+  default=0.0,
+  show_default=True,
+  help="Minimum delay in seconds between starting per-ticker requests.",
+)
+@_FORMAT_OPTION
 @cli_error_handler  # Apply the decorator
-def fetch_candles(provider, ticker, from_date, to_date, timespan, multiplier):
-  """Fetch candle (OHLCV) data for a ticker."""
-  logging.info(f"Executing 'fetch-candles' for {ticker} on provider: {provider}")
+def fetch_candles(
+  provider,
+  tickers,
+  from_date,
+  to_date,
+  timespan,
+  multiplier,
+  cache,
+  max_workers,
+  delay,
+  output_format,
+):
+  """Fetch candle (OHLCV) data for one or more tickers."""
+  symbols = _split_ticker_args(tickers)
+  if not symbols:
+    logging.warning("No valid ticker symbols were provided.")
+    return
+
+  logging.info(
+    f"Executing 'fetch-candles' for {', '.join(symbols)} on provider: {provider}"
+  )
+
+  fetch_kwargs = {
+    "from_date": from_date,
+    "to_date": to_date,
+    "timespan": timespan,
+    "multiplier": multiplier,
+    "cache": cache,
+  }
+  data_provider = _get_provider(provider)
+  get_candles_func = functools.partial(
+    _resolve(provider, data_provider, CandlesFetcher), **fetch_kwargs
+  )
 
-  get_candles_func = _get_fetcher(provider, CandlesFetcher)
-  candles = get_candles_func(
-    ticker=ticker,
+  save = functools.partial(
+    _save_candles,
+    provider=provider,
     from_date=from_date,
     to_date=to_date,
-    timespan=timespan,
-    multiplier=multiplier,
+    output_format=output_format,
   )
 
-  if not candles:
-    logging.warning("No candle data was fetched.")
-    return
+  if len(symbols) == 1:
+    save(symbols[0], get_candles_func(ticker=symbols[0]))
+  elif data_provider.supports(BatchCandlesFetcher):
+    # The provider can fetch every ticker in a single batched request, which
+    # paces itself; the per-ticker pool options don't apply here.
+    log = logging.warning if delay > 0 else logging.info
+    log(
+      f"'{provider}' fetches all tickers in one batched request; "
+      "--max-workers and --delay are not used."
+    )
+    get_candles_batch = data_provider.get_fetcher(BatchCandlesFetcher)
+    candles_by_symbol = get_candles_batch(tickers=symbols, **fetch_kwargs)
+    for symbol in symbols:
+      save(symbol, candles_by_symbol.get(symbol, []))
+  else:
+    # Each ticker is an independent, I/O-bound request, so fan them out.
+    # Workers share one limiter so --delay bounds the overall request rate.
+    limiter = TokenBucket(rate=1 / delay) if delay > 0 else None
 
-  filename = f"{provider}_{ticker}_candles_{from_date}_to_{to_date}.csv"
-  logging.info(f"Saving {len(candles)} candles to {filename}...")
-  save_to_csv([c.model_dump() for c in candles], filename)
+    def fetch(symbol: str) -> list:
+      if limiter:
+        limiter.acquire()
+      return get_candles_func(ticker=symbol)
+
+    workers = max(1, min(max_workers, len(symbols)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+      futures = {executor.submit(fetch, symbol): symbol for symbol in symbols}
+      # Save each ticker as soon as it arrives, overlapping writes with fetches.
+      for future in as_completed(futures):
+        save(futures[future], future.result())
 
 
 @cli.command()
@@ -149,41 +322,45 @@ def fetch_candles(provider, ticker, from_date, to_date, timespan, multiplier):
   default=None,
   help="Delay in seconds between batch requests. Defaults to provider-specific value.",
 )
+@click.option(
+  "--cache/--no-cache",
+  default=True,
+  show_default=True,
+  help="Reuse fresh results from the on-disk cache.",
+)
 @cli_error_handler
 def fetch_metadata(
-  provider: str, tickers: tuple[str, ...], chunk_size: int, delay: float
+  provider: str, tickers: tuple[str, ...], chunk_size: int, delay: float, cache: bool
 ) -> None:
   """Fetch metadata such as market cap for one or more tickers."""
   logging.info(f"Executing 'fetch-metadata' for provider: {provider}")
 
-  metadata_fetcher = _get_fetcher(provider, MetadataFetcher)
+  data_provider = _get_provider(provider)
+  metadata_fetcher = _resolve(provider, data_provider, MetadataFetcher)
 
-  symbols_to_fetch: list[str] = []
   if tickers:
-    # If tickers are provided, normalize them
-    for value in tickers:
-      symbols_to_fetch.extend(
-        segment.strip().upper() for segment in value.split(",") if segment.strip()
-      )
+    # If tickers are provided, normalize and dedupe them in a single pass
+    unique_tickers = _split_ticker_args(tickers)
   else:
     # If no tickers are provided, fetch all tickers from the provider
     logging.warning(
       f"No tickers provided. Fetching all available tickers from '{provider}' first. This may be very slow."
     )
-    tickers_fetcher = _get_fetcher(provider, TickersFetcher)
-    all_provider_tickers = tickers_fetcher(exchange=None)
-    symbols_to_fetch = [t.ticker for t in all_provider_tickers if t.ticker]
-
-  if not symbols_to_fetch:
-    logging.warning("No valid ticker symbols were provided or found.")
-    return
+    tickers_fetcher = _resolve(provider, data_provider, TickersFetcher)
+    all_provider_tickers = tickers_fetcher(exchange=None, cache=cache)
+    unique_tickers = list(
+      dict.fromkeys(t.ticker for t in all_provider_tickers if t.ticker)
+    )
 
-  unique_tickers = list(dict.fromkeys(symbols_to_fetch))
   if not unique_tickers:
-    logging.warning("No unique tickers remained after normalization.")
+    logging.warning("No valid ticker symbols were provided or found.")
     return
 
-  fetcher_kwargs = {"tickers": unique_tickers, "chunk_size": chunk_size}
+  fetcher_kwargs = {
+    "tickers": unique_tickers,
+    "chunk_size": chunk_size,
+    "cache": cache,
+  }
   if delay is not None:
     fetcher_kwargs["delay"] = delay
 
@@ -204,7 +381,7 @@ def fetch_metadata(
   )
   filename = f"{provider}_{suffix}_metadata.csv"
   logging.info(f"Saving metadata for {len(metadata)} tickers to {filename}...")
-  save_to_csv([item.model_dump() for item in metadata], filename)
+  save_models_to_csv(metadata, filename)
 
 
 @cli.command()
@@ -243,24 +420,25 @@ def fetch_tickers_metadata(
   """Fetch tickers, then enrich them with metadata in one pass."""
   logging.info(f"Executing 'fetch-tickers-metadata' for provider: {provider}")
 
-  tickers_fetcher = _get_fetcher(provider, TickersFetcher)
-  metadata_fetcher = _get_fetcher(provider, MetadataFetcher)
+  data_provider = _get_provider(provider)
+  tickers_fetcher = _resolve(provider, data_provider, TickersFetcher)
+  metadata_fetcher = _resolve(provider, data_provider, MetadataFetcher)
 
   tickers = tickers_fetcher(exchange=exchange)
   if not tickers:
     logging.warning("No tickers were fetched.")
     return
 
-  symbol_order: list[str] = []
+  # Flat models keep their field values in __dict__; no serialization needed.
+  # The dict keeps first-seen order, so it doubles as the symbol order.
   base_map: dict[str, dict] = {}
   for ticker in tickers:
-    if limit and len(symbol_order) >= limit:
-      break
-    symbol = ticker.ticker.upper() if ticker.ticker else None
-    if not symbol or symbol in base_map:
-      continue
-    symbol_order.append(symbol)
-    base_map[symbol] = ticker.model_dump()
+    symbol = (ticker.ticker or "").upper()
+    if symbol and symbol not in base_map:
+      base_map[symbol] = ticker.__dict__
+      if limit and len(base_map) >= limit:
+        break
+  symbol_order = list(base_map)
 
   if not symbol_order:
     logging.warning("Fetched tickers but no symbols were usable after normalization.")
@@ -283,31 +461,14 @@ def fetch_tickers_metadata(
       ", ".join(missing[:10]) + ("..." if len(missing) > 10 else ""),
     )
 
-  rows: list[dict] = []
-  for symbol in symbol_order:
-    base = base_map.get(symbol)
-    if not base:
-      continue
-    enriched = base.copy()
-    enriched_meta = metadata_map.get(symbol)
-    if enriched_meta:
-      meta_payload = enriched_meta.model_dump()
-      for key, value in meta_payload.items():
-        if value is not None:
-          enriched[key] = value
-    rows.append(enriched)
-
-  if not rows:
-    logging.warning("No rows remained after combining ticker metadata.")
-    return
-
   filename = f"{provider}_{(exchange or 'all').lower()}_tickers_metadata.csv"
   logging.info(
     "Saving metadata-enriched tickers (%d rows) to %s...",
-    len(rows),
+    len(base_map),
     filename,
   )
-  save_to_csv(rows, filename)
+  # Rows are merged lazily and streamed straight into the CSV writer.
+  save_to_csv(_enrich_rows(base_map, metadata_map), filename)
 
 
 @cli.command()
@@ -318,7 +479,11 @@ def fetch_tickers_metadata(
   "--type",
   "option_type",
   default="all",
-  help="Type of options symbols: all, weeklies, quarterlies (CBOE only).",
+  help=(
+    "Type of options symbols: all, weeklies, quarterlies (CBOE only; other "
+    "providers ignore it). Comma-separate several CBOE types to download them "
+    "concurrently."
+  ),
 )
 @click.option(
   "--exchange", help="The exchange to filter by (for providers that support it)."
@@ -334,17 +499,31 @@ def fetch_tickers_metadata(
   default=None,
   help="Delay in seconds between requests. Defaults to provider-specific value.",
 )
+@click.option(
+  "--cache/--no-cache",
+  default=True,
+  show_default=True,
+  help="Reuse fresh results from the on-disk cache.",
+)
 @cli_error_handler
 def fetch_optionable_tickers(
-  provider: str, option_type: str, exchange: str, max_tickers: int, delay: float
+  provider: str,
+  option_type: str,
+  exchange: str,
+  max_tickers: int,
+  delay: float,
+  cache: bool,
 ) -> None:
   """Fetch a list of optionable tickers from a provider."""
   logging.info(f"Executing 'fetch-optionable-tickers' for provider: {provider}")
 
   get_optionable_func = _get_fetcher(provider, OptionableFetcher)
+  option_types = list(
+    dict.fromkeys(t.strip().lower() for t in option_type.split(",") if t.strip())
+  )
 
   # Build kwargs based on provider
-  kwargs = {"type": option_type}
+  kwargs = {"cache": cache}
   if exchange:
     kwargs["exchange"] = exchange
   if max_tickers:
@@ -352,16 +531,39 @@ def fetch_optionable_tickers(
   if delay is not None:
     kwargs["delay"] = delay
 
-  tickers = get_optionable_func(**kwargs)
+  suffix = f"_{max_tickers}" if max_tickers else ""
+
+  def save(symbol_type: str, tickers: list) -> None:
+    if not tickers:
+      logging.warning(f"No {symbol_type} optionable tickers were fetched.")
+      return
+    filename = f"{provider}_{symbol_type}_optionable_tickers{suffix}.csv"
+    logging.info(f"Saving {len(tickers)} optionable tickers to {filename}...")
+    save_models_to_csv(tickers, filename)
+
+  if len(option_types) > 1 and provider not in _OPTION_TYPE_PROVIDERS:
+    # Other providers ignore `type`, so each extra type would repeat the same
+    # full scan (and, for yfinance, double the request rate).
+    logging.warning(
+      f"--type only selects symbol directories for CBOE; '{provider}' ignores it. "
+      f"Fetching once as '{option_types[0]}'."
+    )
+    option_types = option_types[:1]
 
-  if not tickers:
-    logging.warning("No optionable tickers were fetched.")
+  if len(option_types) <= 1:
+    symbol_type = option_types[0] if option_types else "all"
+    save(symbol_type, get_optionable_func(type=symbol_type, **kwargs))
     return
 
-  suffix = f"_{max_tickers}" if max_tickers else ""
-  filename = f"{provider}_{option_type}_optionable_tickers{suffix}.csv"
-  logging.info(f"Saving {len(tickers)} optionable tickers to {filename}...")
-  save_to_csv([t.model_dump() for t in tickers], filename)
+  # Each directory is an independent download; fetch them side by side over
+  # the provider's shared connection pool.
+  with ThreadPoolExecutor(max_workers=len(option_types)) as executor:
+    futures = {
+      executor.submit(get_optionable_func, type=symbol_type, **kwargs): symbol_type
+      for symbol_type in option_types
+    }
+    for future in as_completed(futures):
+      save(futures[future], future.result())
 
 
 if __name__ == "__main__":
@@ -1,11 +1,85 @@
 from __future__ import annotations
 
+import functools
+import logging
 import math
+from collections.abc import Iterable, Sequence
+from typing import Any, Self
 
-from pydantic import BaseModel, ConfigDict, Field, field_validator
+from pydantic import (
+  BaseModel,
+  ConfigDict,
+  Field,
+  TypeAdapter,
+  ValidationError,
+  field_validator,
+)
 
 
-class Candle(BaseModel):
+@functools.cache
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter:
+  return TypeAdapter(list[model])
+
+
+class _Record(BaseModel):
+  """Base for flat market data records."""
+
+  @classmethod
+  def from_records(cls, records: Iterable[dict[str, Any]]) -> list[Self]:
+    """Builds models from already-validated dicts without re-running validation.
+
+    Only use this for data that was produced by these models, e.g. a cache
+    entry written with model_dump(by_alias=True), or for records a mapper has
+    already reduced to correctly typed fields from a fixed-schema source.
+    Untrusted payloads must go through validate_records.
+    """
+    construct = cls.model_construct
+    return [construct(**record) for record in records]
+
+  @classmethod
+  def validate_records(
+    cls, records: Sequence[Any], source: str, from_attributes: bool = False
+  ) -> list[Self]:
+    """Validates many records with a single pydantic-core call.
+
+    Invalid records are logged and skipped while the rest are kept, matching
+    the per-row try/except the providers used before.
+
+    Args:
+      records: Dicts (or objects, with from_attributes) to validate
+      source: Provider name used in log messages, e.g. 'SEC'
+      from_attributes: Read fields from object attributes instead of keys
+
+    Returns:
+      List of validated models, in input order
+    """
+    adapter = _list_adapter(cls)
+    try:
+      return adapter.validate_python(records, from_attributes=from_attributes)
+    except ValidationError as e:
+      # Error locations start with the index of the offending list element.
+      problems: dict[int, list[str]] = {}
+      for error in e.errors():
+        if error["loc"]:
+          field = ".".join(str(part) for part in error["loc"][1:])
+          problems.setdefault(error["loc"][0], []).append(f"{field}: {error['msg']}")
+
+    for index, messages in problems.items():
+      record = records[index]
+      if isinstance(record, dict):
+        label = record.get("ticker")
+      else:
+        label = getattr(record, "ticker", None)
+      logging.warning(
+        f"Skipping {source} {cls.__name__.lower()} '{label or index}' due to "
+        f"validation error: {'; '.join(messages)}"
+      )
+    invalid = problems.keys()
+    valid = [record for i, record in enumerate(records) if i not in invalid]
+    return adapter.validate_python(valid, from_attributes=from_attributes)
+
+
+class Candle(_Record):
   """Represents a single OHLCV candle with Pydantic validation."""
 
   model_config = ConfigDict(from_attributes=True)
@@ -18,10 +92,10 @@ class Candle(BaseModel):
   timestamp: int
 
 
-class Ticker(BaseModel):
+class Ticker(_Record):
   """Represents a stock ticker with Pydantic validation."""
 
-  model_config = ConfigDict(from_attributes=True)
+  model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
   ticker: str
   name: str | None = None
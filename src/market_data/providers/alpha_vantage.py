@@ -3,77 +3,129 @@ from __future__ import annotations
 import functools
 import io
 import logging
-from datetime import datetime
+from types import MappingProxyType
 from typing import Any
 
 import pandas as pd
 import requests
-from alpha_vantage.timeseries import TimeSeries
 from pandas.errors import ParserError
 from pydantic import ValidationError
 
 from market_data.interfaces import CandlesFetcher, TickersFetcher
 from market_data.models import Candle, Ticker
+from market_data.utils.cache import (
+  RECENT_CANDLES_TTL_SECONDS,
+  TICKERS_TTL_SECONDS,
+  disk_cache,
+)
+from market_data.utils.http import make_session
 from market_data.utils.parsers import read_csv_with_conventions
 
+# --- Module Constants ---
+_SESSION = make_session()
+
+_QUERY_URL = "https://www.alphavantage.co/query"
+_LISTING_COLUMNS = {
+  "symbol": "ticker",
+  "assetType": "type",
+  "exchange": "primary_exchange",
+}
+_TICKER_FIELDS = ["ticker", "name", "type", "primary_exchange", "active"]
+_CANDLE_DTYPES = {
+  "open": "float64",
+  "high": "float64",
+  "low": "float64",
+  "close": "float64",
+  "volume": "int64",
+}
+
+
+def _preview(content: bytes, limit: int = 200) -> str:
+  """Returns the start of a response body for log messages."""
+  return content[:limit].decode("utf-8", errors="replace")
+
 
 def _parse_tickers_from_raw(df: pd.DataFrame) -> list[Ticker]:
   """Transforms and validates a raw DataFrame into a list of Ticker objects."""
   if df.empty:
     return []
-  df = df.rename(
-    columns={"symbol": "ticker", "assetType": "type", "exchange": "primary_exchange"}
-  )
-  df["active"] = df["status"] == "Active"
-
-  valid_tickers = []
-  for row in df.itertuples(index=False):
-    try:
-      # Convert the row to a dictionary before validation.
-      valid_tickers.append(Ticker.model_validate(row._asdict()))
-    except ValidationError as e:
-      ticker_symbol = getattr(row, "ticker", "UNKNOWN")
-      logging.warning(f"Skipping ticker '{ticker_symbol}' due to validation error: {e}")
-
-  return valid_tickers
-
-
-def _map_api_candle_to_candle(date_str: str, daily_data: dict) -> Candle:
-  """Maps a daily data entry from Alpha Vantage to a Candle model."""
-  dt_obj = datetime.strptime(date_str, "%Y-%m-%d")
-  return Candle(
-    open=float(daily_data["1. open"]),
-    high=float(daily_data["2. high"]),
-    low=float(daily_data["3. low"]),
-    close=float(daily_data["4. close"]),
-    volume=int(daily_data["6. volume"]),
-    timestamp=int(dt_obj.timestamp() * 1000),
+  df = df.rename(columns=_LISTING_COLUMNS).assign(active=df["status"] == "Active")
+
+  # Select the Ticker fields as whole columns; missing ones come back as NaN,
+  # which is mapped to None before the rows are materialized.
+  records = df.reindex(columns=_TICKER_FIELDS).astype(object)
+  records = records.where(records.notna(), None).to_dict("records")
+  return Ticker.validate_records(records, source="Alpha Vantage")
+
+
+def _map_csv_candles_to_candles(df: pd.DataFrame) -> list[Candle]:
+  """Maps Alpha Vantage's daily CSV rows to Candle models.
+
+  Columns are coerced with a single astype rather than per row. Timestamps
+  are midnight UTC of each trading day, in milliseconds.
+  """
+  if df.empty:
+    return []
+
+  candles = df[list(_CANDLE_DTYPES)].astype(_CANDLE_DTYPES)
+  dates = pd.to_datetime(df["timestamp"], format="%Y-%m-%d")
+  candles["timestamp"] = (dates - pd.Timestamp("1970-01-01")) // pd.Timedelta(
+    milliseconds=1
   )
+  return Candle.validate_records(candles.to_dict("records"), source="Alpha Vantage")
 
 
+@disk_cache("alpha_vantage_tickers", Ticker, ttl=TICKERS_TTL_SECONDS)
 def _get_tickers_impl(api_key: str, **kwargs: Any) -> list[Ticker]:
-  url = f"https://www.alphavantage.co/query?function=LISTING_STATUS&apikey={api_key}"
+  params = {"function": "LISTING_STATUS", "apikey": api_key}
   try:
-    response = requests.get(url, timeout=30)
+    response = _SESSION.get(_QUERY_URL, params=params, timeout=30)
     response.raise_for_status()
-    df = read_csv_with_conventions(io.StringIO(response.text))
+    # Parse the raw bytes; decoding the body to a str first is an extra copy.
+    df = read_csv_with_conventions(io.BytesIO(response.content))
     return _parse_tickers_from_raw(df)
   except ParserError:
-    logging.error(f"Failed to parse CSV from Alpha Vantage: {response.text}")
+    logging.error(
+      f"Failed to parse CSV from Alpha Vantage: {_preview(response.content)}"
+    )
     return []
   except requests.exceptions.RequestException as e:
     logging.error(f"HTTP error fetching Alpha Vantage tickers: {e}", exc_info=True)
     return []
 
 
-def _get_candles_impl(ts_client: TimeSeries, **kwargs: Any) -> list[Candle]:
-  """Fetches daily candle data from the Alpha Vantage API."""
+# Alpha Vantage ignores the requested date range and always returns the latest
+# window, so entries only live for a short while.
+@disk_cache(
+  "alpha_vantage_candles",
+  Candle,
+  ttl=RECENT_CANDLES_TTL_SECONDS,
+  key_args=("ticker", "outputsize"),
+)
+def _get_candles_impl(api_key: str, **kwargs: Any) -> list[Candle]:
+  """Fetches daily candle data from the Alpha Vantage CSV endpoint."""
+  params = {
+    "function": "TIME_SERIES_DAILY_ADJUSTED",
+    "symbol": kwargs["ticker"],
+    "outputsize": kwargs.get("outputsize", "compact"),
+    "datatype": "csv",
+    "apikey": api_key,
+  }
   try:
-    data, _ = ts_client.get_daily_adjusted(
-      symbol=kwargs["ticker"], outputsize=kwargs.get("outputsize", "compact")
-    )
-    return [_map_api_candle_to_candle(d, v) for d, v in data.items()]
-  except ValidationError as e:
+    response = _SESSION.get(_QUERY_URL, params=params, timeout=30)
+    response.raise_for_status()
+    df = read_csv_with_conventions(io.BytesIO(response.content))
+
+    # Errors and rate-limit notices come back as a JSON body with HTTP 200.
+    if "timestamp" not in df.columns:
+      logging.error(
+        f"Unexpected Alpha Vantage candles response for {kwargs['ticker']}: "
+        f"{_preview(response.content)}"
+      )
+      return []
+
+    return _map_csv_candles_to_candles(df)
+  except (ValidationError, KeyError, ValueError) as e:
     # This is an expected error if the API returns malformed data.
     logging.warning(f"Alpha Vantage data failed validation for {kwargs['ticker']}: {e}")
     return []
@@ -90,17 +142,18 @@ class AlphaVantageProvider:
     if not api_key:
       raise ValueError("Alpha Vantage provider requires an API key.")
 
-    ts_client = TimeSeries(key=api_key, output_format="json")
-
-    self._capabilities = {
-      TickersFetcher: functools.partial(_get_tickers_impl, api_key=api_key),
-      CandlesFetcher: functools.partial(_get_candles_impl, ts_client=ts_client),
-    }
+    self._capabilities = MappingProxyType(
+      {
+        TickersFetcher: functools.partial(_get_tickers_impl, api_key=api_key),
+        CandlesFetcher: functools.partial(_get_candles_impl, api_key=api_key),
+      }
+    )
 
   def supports(self, interface_class: type) -> bool:
     return interface_class in self._capabilities
 
   def get_fetcher(self, interface_class: type):
-    if not self.supports(interface_class):
+    fetcher = self._capabilities.get(interface_class)
+    if fetcher is None:
       raise TypeError(f"This provider does not support {interface_class.__name__}")
-    return self._capabilities[interface_class]
+    return fetcher
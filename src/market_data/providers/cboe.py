@@ -2,17 +2,21 @@ from __future__ import annotations
 
 import logging
 from collections.abc import Callable
-from io import StringIO
-from typing import Any
+from io import BytesIO
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
-import pandas as pd
 import requests
-from pydantic import ValidationError
 
 from market_data.interfaces import OptionableFetcher
 from market_data.models import Ticker
+from market_data.utils.cache import TICKERS_TTL_SECONDS, disk_cache
+from market_data.utils.http import make_session
 from market_data.utils.parsers import read_csv_with_conventions
 
+if TYPE_CHECKING:
+  import pandas as pd
+
 # --- Module Constants ---
 _CBOE_URLS = {
   "all": "https://www.cboe.com/us/options/symboldir/?download=csv",
@@ -24,9 +28,38 @@ _HEADERS = {
   "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.6998.166 Safari/537.36"
 }
 
+# Shared so repeated directory downloads reuse the keep-alive connection.
+_SESSION = make_session(headers=_HEADERS)
+
 # --- Private Fetcher Implementation ---
 
 
+def _parse_tickers_from_raw(df: pd.DataFrame) -> list[Ticker]:
+  """Maps the CBOE symbol directory to optionable Ticker objects.
+
+  Symbols and names are cleaned as whole columns; rows without a symbol are
+  dropped and blank names become None before the rows are materialized. The
+  resulting records match the Ticker schema, so they are constructed directly.
+  """
+  import pandas as pd  # Deferred so cached runs never import pandas.
+
+  missing = pd.Series(pd.NA, index=df.index, dtype="string")
+  frame = pd.DataFrame(
+    {
+      "ticker": df["Stock Symbol"].astype("string").str.strip(),
+      "name": df.get("Company Name", missing).astype("string").str.strip(),
+    }
+  )
+  frame = frame[frame["ticker"].fillna("") != ""]
+  frame["name"] = frame["name"].replace("", pd.NA)
+
+  records = frame.astype(object).where(frame.notna(), None)
+  records = records.assign(active=True, optionable=True).to_dict("records")
+  # Symbols are non-empty strings and names str or None, so skip validation.
+  return Ticker.from_records(records)
+
+
+@disk_cache("cboe_optionable", Ticker, ttl=TICKERS_TTL_SECONDS, key_args=("type",))
 def _get_optionable_tickers_impl(**kwargs: Any) -> list[Ticker]:
   """Fetches optionable ticker symbols from CBOE directory.
 
@@ -55,11 +88,11 @@ def _get_optionable_tickers_impl(**kwargs: Any) -> list[Ticker]:
   logging.info(f"Fetching CBOE {symbol_type} optionable symbols from: {url}")
 
   try:
-    response = requests.get(url, timeout=30, headers=_HEADERS)
+    response = _SESSION.get(url, timeout=30)
     response.raise_for_status()
 
-    # Parse CSV content directly from response
-    csv_content = StringIO(response.text)
+    # Parse the raw response bytes; no need to decode the body to a str first
+    csv_content = BytesIO(response.content)
     df = read_csv_with_conventions(csv_content)
 
     if df.empty:
@@ -75,31 +108,7 @@ def _get_optionable_tickers_impl(**kwargs: Any) -> list[Ticker]:
 
     logging.info(f"CBOE CSV loaded with {len(df)} rows and columns: {list(df.columns)}")
 
-    valid_tickers = []
-    for _, row in df.iterrows():
-      try:
-        # Map CBOE CSV columns to our Ticker model
-        mapped_data = {
-          "ticker": str(row.get("Stock Symbol", "")).strip(),
-          "name": str(row.get("Company Name", "")).strip() or None,
-          "active": True,
-          "optionable": True,
-        }
-
-        # Skip empty or truly missing symbols (pandas NaN or empty strings)
-        if pd.isna(row.get("Stock Symbol")) or not mapped_data["ticker"]:
-          continue
-
-        valid_tickers.append(Ticker.model_validate(mapped_data))
-
-      except ValidationError as e:
-        ticker_symbol = row.get("Stock Symbol")
-        logging.warning(
-          f"Skipping CBOE ticker '{ticker_symbol}' due to validation error: {e}"
-        )
-      except Exception as e:
-        logging.warning(f"Error processing CBOE row: {e}")
-        continue
+    valid_tickers = _parse_tickers_from_raw(df)
 
     logging.info(
       f"Successfully parsed {len(valid_tickers)} optionable tickers from CBOE {symbol_type} data"
@@ -126,15 +135,17 @@ class CboeProvider:
   This is a free-tier provider that doesn't require API keys.
   """
 
-  def __init__(self):
-    self._capabilities = {
+  _capabilities = MappingProxyType(
+    {
       OptionableFetcher: _get_optionable_tickers_impl,
     }
+  )
 
   def supports(self, interface_class: type) -> bool:
     return interface_class in self._capabilities
 
   def get_fetcher(self, interface_class: type) -> Callable[..., list[Ticker]]:
-    if not self.supports(interface_class):
+    fetcher = self._capabilities.get(interface_class)
+    if fetcher is None:
       raise TypeError(f"This provider does not support {interface_class.__name__}")
-    return self._capabilities[interface_class]
+    return fetcher
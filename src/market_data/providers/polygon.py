@@ -2,10 +2,17 @@ from __future__ import annotations
 
 import functools
 import logging
-import time
+import os
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from types import MappingProxyType
 from typing import Any
+from urllib.parse import urlencode, urlparse
 
+import requests
 from polygon import RESTClient
+from polygon.rest.models import Agg
 from pydantic import ValidationError
 from requests.exceptions import HTTPError
 
@@ -16,80 +23,353 @@ from market_data.interfaces import (
   TickersFetcher,
 )
 from market_data.models import Candle, Ticker
+from market_data.utils.cache import (
+  TICKERS_TTL_SECONDS,
+  PageCheckpoint,
+  candles_ttl,
+  disk_cache,
+)
+from market_data.utils.http import make_retry, make_session
+from market_data.utils.ratelimit import TokenBucket
 
 # --- Module-level Constants ---
 _MAX_CANDLE_LIMIT = 50000
 _TICKERS_PAGE_LIMIT = 1000
 _RATE_LIMIT_PAUSE_SECONDS = 12
 _OPTIONS_CONTRACTS_LIMIT = 1000  # Max per request for options contracts
+_API_BASE_URL = "https://api.polygon.io"
+_REQUEST_TIMEOUT_SECONDS = 30
+_TICKERS_PATH = "/v3/reference/tickers"
+_OPTIONS_CONTRACTS_PATH = "/v3/reference/options/contracts"
+_AGGS_PATH = (
+  "/v2/aggs/ticker/{ticker}/range/{multiplier}/{timespan}/{from_date}/{to_date}"
+)
 _MAX_RETRIES = 5  # Max retry attempts for rate limited requests
+_REQUESTS_PER_MINUTE = 5  # Free-tier request quota
+_RATE_LIMIT_ENV_VAR = "POLYGON_RATE_LIMIT_PER_MINUTE"
+_METADATA_MAX_WORKERS = 4
+_POOL_MAXSIZE = 16  # Keep-alive connections for concurrent candle/metadata calls
+_WINDOW_MAX_WORKERS = 4  # Concurrent aggs windows per ticker
+# Intraday bars are aggregated from minute bars, which count against the limit.
+_BASE_BARS_PER_DAY = {"minute": 24 * 60, "hour": 24 * 60}
 
 # --- Private Fetcher Implementations ---
 
 
-def _get_candles_impl(client: RESTClient, **kwargs: Any) -> list[Candle]:
-  """Fetches candle data from the Polygon.io API."""
-  try:
-    resp = client.get_aggs(
-      ticker=kwargs["ticker"],
-      multiplier=kwargs.get("multiplier", 1),
-      timespan=kwargs.get("timespan", "day"),
-      from_=kwargs["from_date"],
-      to=kwargs["to_date"],
-      limit=_MAX_CANDLE_LIMIT,
+def _requests_per_minute(kwargs: dict[str, Any]) -> float:
+  """Returns the proactive request quota: the kwarg, the env var, or the free tier.
+
+  Set rate_limit_per_minute (or POLYGON_RATE_LIMIT_PER_MINUTE) to 0 on paid
+  plans to request at full speed and rely on reactive 429 handling alone.
+  """
+  value = kwargs.get("rate_limit_per_minute")
+  if value is None:
+    value = os.getenv(_RATE_LIMIT_ENV_VAR, _REQUESTS_PER_MINUTE)
+  return float(value)
+
+
+@functools.cache
+def _rate_limiter(requests_per_minute: float) -> TokenBucket | None:
+  """Returns the process-wide limiter for a per-minute request quota.
+
+  The limiter allows bursts up to the quota and is shared by every listing
+  page and candle request, so concurrent fetches (e.g. many tickers on the
+  fetch-candles thread pool) draw from one budget instead of each pacing
+  itself. HTTP 429 responses (and their Retry-After header) are still retried
+  by the SDK's urllib3 pool. Returns None when pacing is disabled.
+  """
+  if requests_per_minute <= 0:
+    return None
+  return TokenBucket(
+    rate=requests_per_minute / 60, capacity=max(1.0, requests_per_minute)
+  )
+
+
+def _get_json(session: requests.Session, path: str) -> dict[str, Any]:
+  """GETs an API-relative path and decodes the JSON body, skipping SDK models."""
+  response = session.get(f"{_API_BASE_URL}{path}", timeout=_REQUEST_TIMEOUT_SECONDS)
+  response.raise_for_status()
+  return response.json()
+
+
+def _aggs_to_candles(aggs: Iterable[Agg], source: str) -> list[Candle]:
+  """Converts SDK aggregates to Candle models.
+
+  The SDK has already decoded the JSON into typed fields, so complete bars are
+  built with model_construct, skipping pydantic validation. Only bars with a
+  missing field or a fractional volume go through validation, which logs and
+  skips them as before.
+  """
+  construct = Candle.model_construct
+  candles = []
+  for agg in aggs:
+    volume = agg.volume
+    if None in (agg.open, agg.high, agg.low, agg.close, agg.timestamp) or not (
+      volume is not None and float(volume).is_integer()
+    ):
+      candles.extend(Candle.validate_records([agg], source, from_attributes=True))
+      continue
+    candles.append(
+      construct(
+        open=float(agg.open),
+        high=float(agg.high),
+        low=float(agg.low),
+        close=float(agg.close),
+        volume=int(volume),
+        timestamp=int(agg.timestamp),
+      )
     )
+  return candles
+
+
+def _raw_aggs_to_candles(results: list[dict[str, Any]], source: str) -> list[Candle]:
+  """Converts raw /v2/aggs result dicts ({"o", "h", "l", "c", "v", "t"}) to Candles.
 
-    valid_candles = []
-    for agg in resp:
-      try:
-        # Pydantic can validate directly from the SDK's object attributes.
-        valid_candles.append(Candle.model_validate(agg))
-      except ValidationError as e:
-        logging.warning(
-          f"Skipping polygon candle for {kwargs['ticker']} due to validation error: {e}"
-        )
-    return valid_candles
+  Complete bars are constructed straight from the decoded JSON; incomplete ones
+  take the SDK-model path in _aggs_to_candles, which validates and logs them.
+  """
+  construct = Candle.model_construct
+  candles = []
+  for bar in results:
+    prices = (bar.get("o"), bar.get("h"), bar.get("l"), bar.get("c"))
+    volume, timestamp = bar.get("v"), bar.get("t")
+    if (
+      None in prices
+      or timestamp is None
+      or not (volume is not None and float(volume).is_integer())
+    ):
+      candles.extend(_aggs_to_candles([Agg.from_dict(bar)], source))
+      continue
+    open_, high, low, close = prices
+    candles.append(
+      construct(
+        open=float(open_),
+        high=float(high),
+        low=float(low),
+        close=float(close),
+        volume=int(volume),
+        timestamp=int(timestamp),
+      )
+    )
+  return candles
+
+
+@functools.cache
+def _split_range(
+  from_date: str, to_date: str, timespan: str
+) -> tuple[tuple[str, str], ...]:
+  """Splits a date range into windows that each fit one aggs response.
+
+  Polygon builds intraday bars from minute aggregates and stops at
+  _MAX_CANDLE_LIMIT of them per response. Sizing windows from a full day of
+  minute bars keeps each window within one response, so the windows can be
+  requested concurrently instead of following next_url one page at a time.
+  Daily and longer spans, and non-ISO dates, are returned as a single window.
+  Memoized, since a multi-ticker fetch splits the same range for every ticker.
+  """
+  bars_per_day = _BASE_BARS_PER_DAY.get(timespan)
+  try:
+    start = date.fromisoformat(str(from_date))
+    end = date.fromisoformat(str(to_date))
+  except ValueError:
+    return ((from_date, to_date),)
+  if bars_per_day is None or start > end:
+    return ((from_date, to_date),)
+
+  days_per_window = timedelta(days=max(1, _MAX_CANDLE_LIMIT // bars_per_day))
+  windows = []
+  while start <= end:
+    window_end = min(end, start + days_per_window - timedelta(days=1))
+    windows.append((start.isoformat(), window_end.isoformat()))
+    start = window_end + timedelta(days=1)
+  return tuple(windows)
+
+
+def _fetch_aggs_window(
+  session: requests.Session,
+  path: str,
+  source: str,
+  limiter: TokenBucket | None,
+) -> list[Candle]:
+  """Fetches one aggs range, following next_url if it still spans pages."""
+  candles = []
+  next_path = f"{path}?{urlencode({'limit': _MAX_CANDLE_LIMIT})}"
+  while next_path:
+    if limiter:
+      limiter.acquire()
+    decoded = _get_json(session, next_path)
+    candles.extend(_raw_aggs_to_candles(decoded.get("results", []), source))
+    next_path = _next_page_path(decoded.get("next_url"))
+  return candles
+
+
+@disk_cache(
+  "polygon_candles",
+  Candle,
+  ttl=candles_ttl,
+  key_args=("ticker", "from_date", "to_date", "timespan", "multiplier"),
+)
+def _get_candles_impl(
+  client: RESTClient, session: requests.Session, **kwargs: Any
+) -> list[Candle]:
+  """Fetches candle data from the Polygon.io API.
+
+  By default the /v2/aggs endpoint is called over the provider's HTTP session
+  and its JSON decoded straight into Candles. Long intraday ranges are
+  split into windows of at most one response each (see _split_range) and
+  fetched concurrently; any window that still spans pages follows next_url.
+  Pass use_raw_http=False to use the SDK's paginating iterator and Agg models
+  instead.
+
+  Requests are paced by the shared per-minute quota (see _requests_per_minute),
+  so concurrent calls for many tickers stay under it together.
+  """
+  ticker = kwargs["ticker"]
+  source = f"polygon {ticker}"
+  multiplier = kwargs.get("multiplier", 1)
+  timespan = kwargs.get("timespan", "day")
+  limiter = _rate_limiter(_requests_per_minute(kwargs))
+  try:
+    if not kwargs.get("use_raw_http", True):
+      if limiter:
+        limiter.acquire()
+      aggs = client.list_aggs(
+        ticker=ticker,
+        multiplier=multiplier,
+        timespan=timespan,
+        from_=kwargs["from_date"],
+        to=kwargs["to_date"],
+        limit=_MAX_CANDLE_LIMIT,
+      )
+      return _aggs_to_candles(aggs, source=source)
+
+    paths = [
+      _AGGS_PATH.format(
+        ticker=ticker,
+        multiplier=multiplier,
+        timespan=timespan,
+        from_date=from_date,
+        to_date=to_date,
+      )
+      for from_date, to_date in _split_range(
+        kwargs["from_date"], kwargs["to_date"], timespan
+      )
+    ]
+    if len(paths) == 1:
+      return _fetch_aggs_window(session, paths[0], source, limiter)
+
+    logging.info(f"Fetching {source} candles in {len(paths)} windows")
+    with ThreadPoolExecutor(
+      max_workers=min(len(paths), _WINDOW_MAX_WORKERS)
+    ) as executor:
+      windows = executor.map(
+        lambda path: _fetch_aggs_window(session, path, source, limiter), paths
+      )
+      # executor.map yields in window order, so candles stay chronological.
+      return [candle for window in windows for candle in window]
   except Exception as e:
     logging.error(f"Error with Polygon.io get_candles: {e}", exc_info=True)
     return []
 
 
-def _get_tickers_impl(client: RESTClient, **kwargs: Any) -> list[Ticker]:
-  """Fetches all available tickers from Polygon.io with rate-limiting."""
+def _next_page_path(next_url: str | None) -> str | None:
+  """Converts a response's absolute next_url into an API-relative path."""
+  if not next_url:
+    return None
+  parsed = urlparse(next_url)
+  return f"{parsed.path}?{parsed.query}" if parsed.query else parsed.path
+
+
+def _iter_checkpointed_pages(
+  session: requests.Session,
+  namespace: str,
+  path: str,
+  params: dict[str, Any],
+  transform: Callable[[list[dict[str, Any]]], list[dict[str, Any]]],
+  requests_per_minute: float = _REQUESTS_PER_MINUTE,
+) -> Iterator[list[dict[str, Any]]]:
+  """Yields transformed result pages, checkpointing each one to disk.
+
+  Pages are requested one at a time, following next_url explicitly instead of
+  through the SDK's iterator, so progress is visible: every completed page is
+  saved with the cursor of the next one. If a request fails once the session's
+  retries are exhausted, the exception propagates, and the next call resumes
+  from the last saved page instead of re-downloading everything.
+
+  The next page is fetched on a background thread while the caller processes
+  the current one, so validation overlaps the network round trip and the
+  rate-limit wait.
+  """
+  checkpoint = PageCheckpoint(namespace, {"path": path, **params})
+  saved = checkpoint.load()
+  if saved:
+    pages, next_path = saved
+    logging.info(f"Resuming {namespace} from saved page {len(pages) + 1}")
+    yield from pages
+  else:
+    pages, next_path = [], f"{path}?{urlencode(params)}"
+
+  limiter = _rate_limiter(requests_per_minute)
+  page_number = len(pages)
+
+  def fetch_page(page_path: str) -> tuple[list[dict[str, Any]], str | None]:
+    waited = limiter.acquire() if limiter else 0.0
+    if waited:
+      logging.info(f"Fetched {page_number} pages. Paused {waited:.1f}s for rate limit.")
+
+    decoded = _get_json(session, page_path)
+    records = transform(decoded.get("results", []))
+    return records, _next_page_path(decoded.get("next_url"))
+
+  with ThreadPoolExecutor(max_workers=1) as executor:
+    pending = executor.submit(fetch_page, next_path) if next_path else None
+    while pending:
+      records, next_path = pending.result()
+      checkpoint.save(page_number, records, next_path)
+      page_number += 1
+
+      pending = executor.submit(fetch_page, next_path) if next_path else None
+      yield records
+
+  checkpoint.clear()
+
+
+@disk_cache(
+  "polygon_tickers", Ticker, ttl=TICKERS_TTL_SECONDS, key_args=("exclude_type",)
+)
+def _get_tickers_impl(session: requests.Session, **kwargs: Any) -> list[Ticker]:
+  """Fetches all available tickers from Polygon.io with rate-limiting.
+
+  Listing pages are checkpointed, so a run interrupted by rate limiting
+  resumes where it stopped on the next call. Pages are paced to the free-tier
+  quota unless rate_limit_per_minute says otherwise.
+  """
   all_tickers = []
-  tickers_processed = 0
 
   # Get the type to exclude from the arguments
   exclude_type = kwargs.get("exclude_type")
   if exclude_type:
     logging.info(f"Polygon provider will exclude tickers of type '{exclude_type}'.")
 
+  pages = _iter_checkpointed_pages(
+    session,
+    "polygon_tickers_pages",
+    _TICKERS_PATH,
+    {"market": "stocks", "limit": _TICKERS_PAGE_LIMIT},
+    transform=list,
+    requests_per_minute=_requests_per_minute(kwargs),
+  )
   try:
-    for t in client.list_tickers(limit=_TICKERS_PAGE_LIMIT, market="stocks"):
-      try:
-        validated_ticker = Ticker.model_validate(t)
-
-        # This is the new filtering logic
-        if exclude_type and validated_ticker.type == exclude_type:
-          continue  # Skip this ticker
-
-        all_tickers.append(validated_ticker)
-      except ValidationError as e:
-        ticker_symbol = getattr(t, "ticker", "UNKNOWN")
-        logging.warning(
-          f"Skipping polygon ticker '{ticker_symbol}' due to validation error: {e}"
-        )
-
-      tickers_processed += 1
-      if tickers_processed > 0 and tickers_processed % _TICKERS_PAGE_LIMIT == 0:
-        logging.info(f"Processed {len(all_tickers)} tickers. Pausing for rate limit...")
-        time.sleep(_RATE_LIMIT_PAUSE_SECONDS)
-  except HTTPError as e:
-    logging.error(f"HTTP error fetching tickers from Polygon.io: {e}", exc_info=True)
-    return []
+    for page in pages:
+      page_tickers = Ticker.validate_records(page, source="polygon")
+      if exclude_type:
+        page_tickers = [t for t in page_tickers if t.type != exclude_type]
+      all_tickers.extend(page_tickers)
   except Exception as e:
     logging.error(
-      f"Unexpected error fetching tickers from Polygon.io: {e}", exc_info=True
+      f"Error fetching tickers from Polygon.io: {e}. Progress is saved; "
+      "re-run to resume.",
+      exc_info=True,
     )
     return []
 
@@ -97,64 +377,124 @@ def _get_tickers_impl(client: RESTClient, **kwargs: Any) -> list[Ticker]:
   return all_tickers
 
 
-def _get_optionable_tickers_impl(client: RESTClient, **kwargs: Any) -> list[Ticker]:
+def _underlyings(contracts: list[dict[str, Any]]) -> list[dict[str, Any]]:
+  """Reduces a page of options contracts to its distinct underlyings."""
+  symbols = dict.fromkeys(c.get("underlying_ticker") for c in contracts)
+  return [{"ticker": symbol} for symbol in symbols if symbol]
+
+
+@disk_cache("polygon_optionable", Ticker, ttl=TICKERS_TTL_SECONDS)
+def _get_optionable_tickers_impl(
+  session: requests.Session, **kwargs: Any
+) -> list[Ticker]:
   """Fetches optionable ticker symbols from Polygon.io options contracts API.
 
+  Contract pages are checkpointed (as their distinct underlyings), so a run
+  interrupted by rate limiting resumes where it stopped on the next call.
+
   Args:
-    client: Polygon RESTClient instance
-    **kwargs: Additional keyword arguments
+    session: Authenticated Polygon HTTP session (see _make_session)
+    **kwargs: Additional keyword arguments, e.g. rate_limit_per_minute to
+      override the page quota (0 disables proactive pacing)
 
   Returns:
     List of Ticker objects with optionable=True
   """
-  contracts_processed = 0
-  unique_tickers = set()
-
-  # TODO: Handle rate limiting during pagination - currently if rate limit occurs
-  # during SDK's internal pagination, the entire operation fails and we lose all progress
-  for contract in client.list_options_contracts(limit=_OPTIONS_CONTRACTS_LIMIT):
-    underlying = getattr(contract, "underlying_ticker", None)
-    if underlying:
-      unique_tickers.add(underlying)
-
-    contracts_processed += 1
-    if contracts_processed > 0 and contracts_processed % _TICKERS_PAGE_LIMIT == 0:
-      logging.info(
-        f"Processed {contracts_processed} contracts. Pausing for rate limit..."
-      )
-      time.sleep(_RATE_LIMIT_PAUSE_SECONDS)
+  # Insertion-ordered dedupe; contracts arrive sorted by contract ticker, which
+  # starts with the underlying, so no separate sort pass is needed.
+  unique_tickers: dict[str, None] = {}
+  pages = _iter_checkpointed_pages(
+    session,
+    "polygon_optionable_pages",
+    _OPTIONS_CONTRACTS_PATH,
+    {"limit": _OPTIONS_CONTRACTS_LIMIT},
+    transform=_underlyings,
+    requests_per_minute=_requests_per_minute(kwargs),
+  )
+  for page in pages:
+    unique_tickers.update(dict.fromkeys(record["ticker"] for record in page))
 
   logging.info(f"Found {len(unique_tickers)} unique optionable tickers")
 
-  valid_tickers = []
-  for ticker_symbol in sorted(unique_tickers):
-    try:
-      ticker_obj = Ticker(
-        ticker=ticker_symbol,
-        name=None,  # Options contracts don't include company names
-        active=True,
-        optionable=True,
-      )
-      valid_tickers.append(ticker_obj)
-    except ValidationError as e:
-      logging.warning(f"Skipping ticker '{ticker_symbol}' due to validation error: {e}")
+  # Options contracts don't include company names. Symbols are checked here
+  # rather than by validation, since checkpointed pages come from raw JSON.
+  valid_tickers = Ticker.from_records(
+    {"ticker": symbol, "active": True, "optionable": True}
+    for symbol in unique_tickers
+    if isinstance(symbol, str)
+  )
 
   logging.info(f"Successfully processed {len(valid_tickers)} optionable tickers")
   return valid_tickers
 
 
+def _fetch_ticker_details(client: RESTClient, ticker_symbol: str) -> Ticker | None:
+  """Fetches one ticker's details, returning None if it can't be retrieved."""
+  try:
+    logging.debug(f"Fetching metadata for {ticker_symbol} from Polygon.")
+    # The get_ticker_details is available through the client's reference attribute
+    details = client.get_ticker_details(ticker_symbol)
+
+    # Manually construct the Ticker object from the details response
+    return Ticker(
+      ticker=details.ticker,
+      name=details.name,
+      market=details.market,
+      locale=details.locale,
+      primary_exchange=details.primary_exchange,
+      type=details.type,
+      active=details.active,
+      currency_name=details.currency_name,
+      cik=details.cik,
+      market_cap=int(details.market_cap) if details.market_cap is not None else None,
+    )
+
+  except HTTPError as e:
+    if e.response.status_code == 404:
+      logging.warning(f"Ticker {ticker_symbol} not found on Polygon.io.")
+    else:
+      logging.error(
+        f"HTTP error fetching metadata for {ticker_symbol} from Polygon: {e}",
+        exc_info=True,
+      )
+  except ValidationError as e:
+    logging.warning(
+      f"Skipping Polygon metadata for {ticker_symbol} due to validation error: {e}"
+    )
+  except Exception as e:
+    logging.error(
+      f"An unexpected error occurred fetching metadata for {ticker_symbol}: {e}",
+      exc_info=True,
+    )
+  return None
+
+
+@disk_cache(
+  "polygon_ticker_details", Ticker, ttl=TICKERS_TTL_SECONDS, key_args=("ticker",)
+)
+def _get_ticker_details_impl(client: RESTClient, **kwargs: Any) -> list[Ticker]:
+  """Fetches one ticker's details, cached on disk per symbol."""
+  details = _fetch_ticker_details(client, kwargs["ticker"])
+  return [details] if details is not None else []
+
+
 def _get_ticker_metadata_impl(client: RESTClient, **kwargs: Any) -> list[Ticker]:
   """Fetches enriched metadata for one or more tickers from Polygon.io.
 
-  This implementation iterates through each ticker and makes a separate API call.
-  It respects the delay parameter to avoid hitting rate limits.
+  Details are cached per ticker, so re-running with a ticker added, removed or
+  reordered only requests the symbols not already cached. Polygon only serves
+  details one ticker per call, so the misses run on a small thread pool. A
+  shared token bucket refilling one request per `delay` seconds keeps the
+  overall rate at the quota while overlapping the network round-trips,
+  instead of sleeping after every request.
 
   Args:
     client: The Polygon RESTClient.
-    **kwargs: Expects 'tickers' (a list of strings) and 'delay' (float).
+    **kwargs: Expects 'tickers' (a list of strings) and 'delay' (float), plus
+      optional 'cache' (bool) to bypass the per-ticker cache.
 
   Returns:
-    A list of Ticker objects with enriched metadata.
+    A list of Ticker objects with enriched metadata, in request order.
   """
   tickers_param = kwargs.get("tickers", [])
   delay = kwargs.get("delay", _RATE_LIMIT_PAUSE_SECONDS)
@@ -163,57 +503,64 @@ def _get_ticker_metadata_impl(client: RESTClient, **kwargs: Any) -> list[Ticker]
     logging.warning("No tickers provided for Polygon metadata fetch.")
     return []
 
-  logging.info(
-    "Fetching Polygon metadata for %d tickers (delay %.2fs)",
-    len(tickers_param),
-    delay,
+  results: dict[str, list[Ticker]] = {}
+  if kwargs.get("cache", True):
+    for symbol in tickers_param:
+      cached = _get_ticker_details_impl.load(ticker=symbol)
+      if cached is not None:
+        results[symbol] = cached
+
+  missing = list(dict.fromkeys(s for s in tickers_param if s not in results))
+  if missing:
+    logging.info(
+      "Fetching Polygon metadata for %d tickers (delay %.2fs)",
+      len(missing),
+      delay,
+    )
+
+    # No burst capacity: requests start at least `delay` seconds apart.
+    limiter = TokenBucket(rate=1 / delay) if delay else None
+
+    def fetch(ticker_symbol: str) -> list[Ticker]:
+      if limiter:
+        limiter.acquire()
+      # The cache was already checked above; this fetches and stores the entry.
+      return _get_ticker_details_impl(client, ticker=ticker_symbol, cache=False)
+
+    workers = min(_METADATA_MAX_WORKERS, len(missing))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+      results.update(zip(missing, executor.map(fetch, missing), strict=True))
+
+  return [ticker for symbol in tickers_param for ticker in results.get(symbol, [])]
+
+
+def _make_client(api_key: str) -> RESTClient:
+  """Creates a RESTClient whose connection pool suits this module's usage.
+
+  The SDK already requests gzip, but its urllib3 pool keeps a single
+  connection per host and retries with a 0.1s backoff. The pool is widened so
+  concurrent callers (the metadata workers, fetch-candles' per-ticker pool)
+  reuse keep-alive connections instead of discarding them, and 429/5xx
+  responses back off like the project's other HTTP clients.
+  """
+  client = RESTClient(api_key, retries=_MAX_RETRIES)
+  client.client.connection_pool_kw.update(
+    maxsize=_POOL_MAXSIZE, retries=make_retry(_MAX_RETRIES)
   )
+  return client
 
-  metadata_list = []
-  for i, ticker_symbol in enumerate(tickers_param):
-    try:
-      logging.debug(f"Fetching metadata for {ticker_symbol} from Polygon.")
-      # The get_ticker_details is available through the client's reference attribute
-      details = client.get_ticker_details(ticker_symbol)
-
-      # Manually construct the Ticker object from the details response
-      ticker_obj = Ticker(
-        ticker=details.ticker,
-        name=details.name,
-        market=details.market,
-        locale=details.locale,
-        primary_exchange=details.primary_exchange,
-        type=details.type,
-        active=details.active,
-        currency_name=details.currency_name,
-        cik=details.cik,
-        market_cap=int(details.market_cap) if details.market_cap is not None else None,
-      )
-      metadata_list.append(ticker_obj)
-
-    except HTTPError as e:
-      if e.response.status_code == 404:
-        logging.warning(f"Ticker {ticker_symbol} not found on Polygon.io.")
-      else:
-        logging.error(
-          f"HTTP error fetching metadata for {ticker_symbol} from Polygon: {e}",
-          exc_info=True,
-        )
-    except ValidationError as e:
-      logging.warning(
-        f"Skipping Polygon metadata for {ticker_symbol} due to validation error: {e}"
-      )
-    except Exception as e:
-      logging.error(
-        f"An unexpected error occurred fetching metadata for {ticker_symbol}: {e}",
-        exc_info=True,
-      )
 
-    # Apply delay between requests, but not after the last one
-    if i < len(tickers_param) - 1:
-      time.sleep(delay)
+def _make_session(api_key: str) -> requests.Session:
+  """Creates the HTTP session used for raw JSON endpoints (aggs, listings).
 
-  return metadata_list
+  The SDK's request helper is private, so these endpoints are called through
+  a regular retrying session sending the same bearer-token auth instead.
+  """
+  return make_session(
+    headers={"Authorization": f"Bearer {api_key}"},
+    total_retries=_MAX_RETRIES,
+    pool_maxsize=_POOL_MAXSIZE,
+  )
 
 
 # --- Public Provider Class ---
@@ -224,19 +571,27 @@ class PolygonProvider:
     if not api_key:
       raise ValueError("Polygon provider requires an API key.")
 
-    client = RESTClient(api_key, retries=_MAX_RETRIES)
-
-    self._capabilities = {
-      TickersFetcher: functools.partial(_get_tickers_impl, client=client),
-      CandlesFetcher: functools.partial(_get_candles_impl, client=client),
-      OptionableFetcher: functools.partial(_get_optionable_tickers_impl, client=client),
-      MetadataFetcher: functools.partial(_get_ticker_metadata_impl, client=client),
-    }
+    client = _make_client(api_key)
+    session = _make_session(api_key)
+
+    self._capabilities = MappingProxyType(
+      {
+        TickersFetcher: functools.partial(_get_tickers_impl, session=session),
+        CandlesFetcher: functools.partial(
+          _get_candles_impl, client=client, session=session
+        ),
+        OptionableFetcher: functools.partial(
+          _get_optionable_tickers_impl, session=session
+        ),
+        MetadataFetcher: functools.partial(_get_ticker_metadata_impl, client=client),
+      }
+    )
 
   def supports(self, interface_class: type) -> bool:
     return interface_class in self._capabilities
 
   def get_fetcher(self, interface_class: type):
-    if not self.supports(interface_class):
+    fetcher = self._capabilities.get(interface_class)
+    if fetcher is None:
       raise TypeError(f"This provider does not support {interface_class.__name__}")
-    return self._capabilities[interface_class]
+    return fetcher
@@ -2,13 +2,15 @@ from __future__ import annotations
 
 import json
 import logging
+from types import MappingProxyType
 from typing import Any
 
 import requests
-from pydantic import ValidationError
 
 from market_data.interfaces import TickersFetcher
 from market_data.models import Ticker
+from market_data.utils.cache import TICKERS_TTL_SECONDS, ConditionalCache, disk_cache
+from market_data.utils.http import make_session
 
 # --- Module Constants ---
 _SEC_URL = "https://www.sec.gov/files/company_tickers.json"
@@ -16,17 +18,52 @@ _HEADERS = {
   "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10.15; rv:141.0) Gecko/20100101 Firefox/141.0"
 }
 
+# Shared so repeated downloads reuse the keep-alive connection and retry policy.
+_SESSION = make_session(headers=_HEADERS)
+
+_SEC_COLUMNS = {"ticker": "ticker", "title": "name", "cik_str": "cik"}
+
 # --- Private Fetcher Implementation ---
 
 
+def _parse_tickers_from_raw(data: dict[str, dict[str, Any]]) -> list[Ticker]:
+  """Maps the SEC company_tickers.json payload to Ticker objects.
+
+  The payload is loaded into one DataFrame and cleaned as whole columns; rows
+  without a ticker symbol are dropped and counted. Every remaining field is a
+  string or None, so the models are constructed without per-row validation.
+  """
+  import pandas as pd  # Deferred so cached runs never import pandas.
+
+  frame = pd.DataFrame(list(data.values()), columns=list(_SEC_COLUMNS))
+  frame = frame.rename(columns=_SEC_COLUMNS).astype("string")
+  frame["ticker"] = frame["ticker"].str.strip()
+
+  missing = frame["ticker"].fillna("") == ""
+  if missing.any():
+    logging.warning(f"Skipping {int(missing.sum())} SEC entries without a ticker.")
+  frame = frame[~missing]
+
+  records = frame.astype(object).where(frame.notna(), None)
+  return Ticker.from_records(records.assign(active=True).to_dict("records"))
+
+
+@disk_cache("sec_tickers", Ticker, ttl=TICKERS_TTL_SECONDS)
 def _get_tickers_impl(**kwargs: Any) -> list[Ticker]:
-  """Fetches company ticker data from the SEC's public JSON file."""
+  """Fetches company ticker data from the SEC's public JSON file.
+
+  The file is revalidated with a conditional GET, so when it hasn't changed
+  since the last download the previously parsed tickers are reused.
+  """
   logging.info(f"Downloading ticker list from SEC: {_SEC_URL}")
+  conditional = ConditionalCache("sec_company_tickers", Ticker)
 
   try:
-    # Pass the headers with the request.
-    response = requests.get(_SEC_URL, timeout=30, headers=_HEADERS)
+    response = _SESSION.get(_SEC_URL, timeout=30, headers=conditional.request_headers())
     response.raise_for_status()
+    if response.status_code == 304:
+      logging.info("SEC ticker list is unchanged since the last download.")
+      return conditional.load() or []
     data = response.json()
   except requests.exceptions.RequestException as e:
     logging.error(f"HTTP error fetching SEC tickers: {e}", exc_info=True)
@@ -35,23 +72,10 @@ def _get_tickers_impl(**kwargs: Any) -> list[Ticker]:
     logging.error(f"Failed to parse JSON from SEC response: {e}", exc_info=True)
     return []
 
-  valid_tickers = []
-  for company_data in data.values():
-    try:
-      mapped_data = {
-        "ticker": company_data.get("ticker"),
-        "name": company_data.get("title"),
-        "cik": str(company_data.get("cik_str")),
-        "active": True,
-      }
-      valid_tickers.append(Ticker.model_validate(mapped_data))
-    except ValidationError as e:
-      ticker_symbol = company_data.get("ticker", "UNKNOWN")
-      logging.warning(
-        f"Skipping SEC ticker '{ticker_symbol}' due to validation error: {e}"
-      )
+  valid_tickers = _parse_tickers_from_raw(data)
 
   logging.info(f"Successfully parsed {len(valid_tickers)} tickers from SEC data.")
+  conditional.store(response.headers, valid_tickers)
   return valid_tickers
 
 
@@ -59,15 +83,17 @@ def _get_tickers_impl(**kwargs: Any) -> list[Ticker]:
 
 
 class SecProvider:
-  def __init__(self):
-    self._capabilities = {
+  _capabilities = MappingProxyType(
+    {
       TickersFetcher: _get_tickers_impl,
     }
+  )
 
   def supports(self, interface_class: type) -> bool:
     return interface_class in self._capabilities
 
   def get_fetcher(self, interface_class: type):
-    if not self.supports(interface_class):
+    fetcher = self._capabilities.get(interface_class)
+    if fetcher is None:
       raise TypeError(f"This provider does not support {interface_class.__name__}")
-    return self._capabilities[interface_class]
+    return fetcher
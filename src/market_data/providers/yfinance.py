@@ -1,33 +1,39 @@
 from __future__ import annotations
 
+import functools
 import json
 import logging
-import time
-from typing import Any
-
-import pandas as pd
-import yfinance as yf
-from yfinance.data import YfData
-from yfinance.scrapers import quote
-
-try:
-  from curl_cffi import requests as curl_requests
-except ImportError:  # pragma: no cover - fallback for environments without curl_cffi
-  import requests as curl_requests  # type: ignore[assignment]
-
-from pydantic import ValidationError
+import math
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
 
 from market_data.interfaces import (
+  BatchCandlesFetcher,
   CandlesFetcher,
   MetadataFetcher,
   OptionableFetcher,
   TickersFetcher,
 )
 from market_data.models import Candle, Ticker
-from market_data.utils.parsers import read_csv_with_conventions
+from market_data.utils.cache import TICKERS_TTL_SECONDS, candles_ttl, disk_cache
+from market_data.utils.parsers import split_delimited_with_conventions
+from market_data.utils.ratelimit import TokenBucket
+
+if TYPE_CHECKING:
+  import pandas as pd
+  import yfinance as yf
+  from yfinance.data import YfData
+
+# yfinance, pandas and curl_cffi take a large share of CLI start-up time, and
+# cached ticker lists need none of them, so they are imported on first use.
 
 # --- Module-level Constants ---
 _YFINANCE_DEFAULT_DELAY = 2.0
+_OPTIONS_CHECK_MAX_WORKERS = 16
+_QUOTE_CHUNK_SIZE = 50
+_METADATA_MAX_WORKERS = 8
 
 # --- Ticker Fetching Logic ---
 
@@ -35,15 +41,39 @@ _YFINANCE_HEADERS = {
   "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.6998.166 Safari/537.36",
 }
 
+# yfinance.scrapers.quote._QUERY1_URL_, spelled out to avoid importing yfinance.
+_QUOTE_URL = "https://query1.finance.yahoo.com/v7/finance/quote"
+
 _YF_DATA_CLIENT: YfData | None = None
 
 
+@functools.cache
+def _get_yf_session() -> Any:
+  """Returns the browser-impersonating session shared by all yfinance calls."""
+  try:
+    from curl_cffi import requests as curl_requests
+  except ImportError:  # pragma: no cover - fallback for environments without curl_cffi
+    import requests as curl_requests  # type: ignore[assignment]
+
+  session = curl_requests.Session(impersonate="chrome")
+  session.headers.update(_YFINANCE_HEADERS)
+  return session
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_yf_ticker(symbol: str) -> yf.Ticker:
+  """Returns a shared yf.Ticker per symbol so its scraped state is reused."""
+  import yfinance as yf
+
+  return yf.Ticker(symbol, session=_get_yf_session())
+
+
 def _get_yf_data_client() -> YfData:
   global _YF_DATA_CLIENT
   if _YF_DATA_CLIENT is None:
-    session = curl_requests.Session(impersonate="chrome")
-    session.headers.update(_YFINANCE_HEADERS)
-    _YF_DATA_CLIENT = YfData(session=session)
+    from yfinance.data import YfData
+
+    _YF_DATA_CLIENT = YfData(session=_get_yf_session())
   return _YF_DATA_CLIENT
 
 
@@ -53,33 +83,45 @@ def _chunk_symbols(symbols: list[str], chunk_size: int) -> list[list[str]]:
   return [symbols[i : i + chunk_size] for i in range(0, len(symbols), chunk_size)]
 
 
+def _quote_str(raw_quote: dict[str, Any], *keys: str) -> str | None:
+  """Returns the first non-empty string among the given quote fields."""
+  for key in keys:
+    value = raw_quote.get(key)
+    if value and isinstance(value, str):
+      return value
+  return None
+
+
 def _build_ticker_from_quote(raw_quote: dict[str, Any]) -> Ticker | None:
-  symbol = raw_quote.get("symbol")
+  """Maps one v7 quote to a Ticker, or None if it has no symbol.
+
+  Fields are type-checked explicitly and the model is constructed directly, so
+  malformed values are dropped field by field instead of raising (and
+  discarding) a ValidationError for the whole quote.
+  """
+  symbol = _quote_str(raw_quote, "symbol")
   if not symbol:
     return None
 
-  ticker_payload = {
-    "ticker": symbol,
-    "name": raw_quote.get("longName") or raw_quote.get("shortName"),
-    "active": True,
-    "optionable": raw_quote.get("hasOptions"),
-    "market_cap": raw_quote.get("marketCap"),
-    "market": raw_quote.get("market"),
-    "locale": raw_quote.get("region"),
-    "type": raw_quote.get("quoteType"),
-    "primary_exchange": raw_quote.get("fullExchangeName"),
-    "currency_name": raw_quote.get("currency"),
-  }
-
-  try:
-    return Ticker.model_validate(ticker_payload)
-  except ValidationError as exc:
-    logging.debug(
-      "Skipping yfinance metadata for %s due to validation error: %s",
-      symbol,
-      exc,
-    )
-    return None
+  has_options = raw_quote.get("hasOptions")
+  market_cap = raw_quote.get("marketCap")
+  if isinstance(market_cap, float) and market_cap.is_integer():
+    market_cap = int(market_cap)
+  elif not isinstance(market_cap, int) or isinstance(market_cap, bool):
+    market_cap = None
+
+  return Ticker.model_construct(
+    ticker=symbol,
+    name=_quote_str(raw_quote, "longName", "shortName"),
+    active=True,
+    optionable=has_options if isinstance(has_options, bool) else None,
+    market_cap=market_cap,
+    market=_quote_str(raw_quote, "market"),
+    locale=_quote_str(raw_quote, "region"),
+    type=_quote_str(raw_quote, "quoteType"),
+    primary_exchange=_quote_str(raw_quote, "fullExchangeName"),
+    currency_name=_quote_str(raw_quote, "currency"),
+  )
 
 
 _EXCHANGE_SOURCES = {
@@ -94,8 +136,44 @@ _EXCHANGE_SOURCES = {
     "name_col": "Security Name",
   },
 }
+_LISTING_FOOTER_PREFIX = "File Creation Time"
+
+
+@functools.lru_cache(maxsize=len(_EXCHANGE_SOURCES))
+def _download_listing(url: str) -> bytes:
+  """Downloads a symbol directory file once per process.
+
+  Parsed tickers are cached on disk by _get_tickers_impl; this keeps repeated
+  in-process lookups (e.g. per-exchange and all-exchange fetches) from
+  re-downloading the same file.
+  """
+  with urllib.request.urlopen(url, timeout=60) as response:
+    return response.read()
 
 
+def _fetch_exchange_tickers(exch_name: str) -> list[Ticker]:
+  """Downloads and parses the listing file for a single configured exchange."""
+  source_info = _EXCHANGE_SOURCES.get(exch_name)
+  if not source_info:
+    logging.warning(
+      f"yfinance exchange '{exch_name}' not found in configuration. Skipping."
+    )
+    return []
+
+  try:
+    logging.info(f"Fetching yfinance tickers for exchange: {exch_name}")
+    listing = _download_listing(source_info["url"])
+    return _parse_listing(listing, source_info["ticker_col"], source_info["name_col"])
+  except Exception as e:
+    logging.error(
+      f"Failed to fetch tickers for yfinance exchange '{exch_name}': {e}",
+      exc_info=True,
+    )
+    # Continue with the other exchanges even if one fails
+    return []
+
+
+@disk_cache("yfinance_tickers", Ticker, ttl=TICKERS_TTL_SECONDS, key_args=("exchange",))
 def _get_tickers_impl(**kwargs: Any) -> list[Ticker]:
   exchange = kwargs.get("exchange")
 
@@ -107,60 +185,47 @@ def _get_tickers_impl(**kwargs: Any) -> list[Ticker]:
     logging.info(
       f"No exchange specified for yfinance. Fetching from all sources: {list(_EXCHANGE_SOURCES.keys())}"
     )
-    exchanges_to_fetch = _EXCHANGE_SOURCES.keys()
-
-  all_tickers = []
-  for exch_name in exchanges_to_fetch:
-    source_info = _EXCHANGE_SOURCES.get(exch_name)
-    if not source_info:
-      logging.warning(
-        f"yfinance exchange '{exch_name}' not found in configuration. Skipping."
-      )
-      continue
+    exchanges_to_fetch = list(_EXCHANGE_SOURCES.keys())
 
-    try:
-      logging.info(f"Fetching yfinance tickers for exchange: {exch_name}")
-      df = read_csv_with_conventions(source_info["url"], sep="|")
-      tickers = _process_ticker_dataframe(
-        df, source_info["ticker_col"], source_info["name_col"]
-      )
-      all_tickers.extend(tickers)
-    except Exception as e:
-      logging.error(
-        f"Failed to fetch tickers for yfinance exchange '{exch_name}': {e}",
-        exc_info=True,
-      )
-      # Continue to the next exchange even if one fails
-      continue
+  if len(exchanges_to_fetch) == 1:
+    return _fetch_exchange_tickers(exchanges_to_fetch[0])
 
-  return all_tickers
+  # The listing downloads are independent and I/O-bound, so overlap them.
+  # executor.map preserves the configured exchange order in the result.
+  with ThreadPoolExecutor(max_workers=len(exchanges_to_fetch)) as executor:
+    results = executor.map(_fetch_exchange_tickers, exchanges_to_fetch)
+    return [ticker for tickers in results for ticker in tickers]
 
 
-def _process_ticker_dataframe(
-  df: pd.DataFrame, ticker_col: str, name_col: str
-) -> list[Ticker]:
-  if df.empty:
+def _parse_listing(listing: bytes, ticker_col: str, name_col: str) -> list[Ticker]:
+  """Parses a nasdaqtrader symbol directory file into Ticker objects."""
+  header, rows = split_delimited_with_conventions(listing.decode("utf-8"), sep="|")
+  if not rows:
     return []
 
-  # This line removes the footer from the raw data.
-  df = df.iloc[:-1]
-
-  df = df.rename(columns={ticker_col: "ticker", name_col: "name"})
-  df["active"] = (
-    (df["Financial Status"] == "N") if "Financial Status" in df.columns else True
+  ticker_idx = header.index(ticker_col)
+  name_idx = header.index(name_col)
+  status_idx = (
+    header.index("Financial Status") if "Financial Status" in header else None
   )
 
-  valid_tickers = []
-  for row in df.itertuples(index=False):
-    try:
-      # Convert row to dict and validate with Pydantic
-      valid_tickers.append(Ticker.model_validate(row._asdict()))
-    except ValidationError as e:
-      ticker_symbol = getattr(row, "ticker", "UNKNOWN")
-      logging.warning(
-        f"Skipping yfinance ticker '{ticker_symbol}' due to validation error: {e}"
-      )
-  return valid_tickers
+  records = []
+  for row in rows:
+    # Skip the "File Creation Time: ..." footer and any truncated lines.
+    if len(row) != len(header):
+      continue
+    symbol = row[ticker_idx]
+    if not symbol or symbol.startswith(_LISTING_FOOTER_PREFIX):
+      continue
+    records.append(
+      {
+        "ticker": symbol,
+        "name": row[name_idx],
+        "active": status_idx is None or row[status_idx] == "N",
+      }
+    )
+  # Every field is already a str, None or bool, so validation is skipped.
+  return Ticker.from_records(records)
 
 
 # --- Optionable Tickers Fetching Logic ---
@@ -176,7 +241,7 @@ def _check_ticker_has_options(ticker_symbol: str) -> bool:
     True if the ticker has options, False otherwise
   """
   try:
-    ticker = yf.Ticker(ticker_symbol)
+    ticker = _get_yf_ticker(ticker_symbol)
     options = ticker.options
     return len(options) > 0
   except Exception as e:
@@ -189,15 +254,24 @@ def _get_optionable_tickers_impl(**kwargs: Any) -> list[Ticker]:
 
   This implementation:
   1. Gets all tickers using the existing ticker fetching logic
-  2. Checks each ticker individually for options availability
-  3. Applies rate limiting to avoid Yahoo Finance throttling
-  4. Returns only tickers that have options available
+  2. Reads the hasOptions flag from the bulk quote endpoint, 50 symbols per
+     request
+  3. Checks any tickers the quote endpoint didn't answer individually, on a
+     thread pool
+  4. Applies rate limiting to avoid Yahoo Finance throttling
+  5. Returns only tickers that have options available
+
+  Individual checks run concurrently, but all workers share one token bucket,
+  so requests still start at most once per `delay` seconds overall.
 
   Args:
     **kwargs: Same arguments as _get_tickers_impl (exchange, etc.)
     plus optional:
       - max_tickers: Maximum number of tickers to check (for testing)
-      - delay: Delay in seconds between requests
+      - delay: Minimum delay in seconds between starting requests
+      - max_workers: Maximum number of concurrent individual checks
+      - use_bulk: Set to False to skip the quote endpoint and check every
+        ticker individually
 
   Returns:
     List of Ticker objects with optionable=True
@@ -205,6 +279,8 @@ def _get_optionable_tickers_impl(**kwargs: Any) -> list[Ticker]:
   # Get configuration
   max_tickers = kwargs.get("max_tickers")
   delay = kwargs.get("delay", _YFINANCE_DEFAULT_DELAY)
+  max_workers = kwargs.get("max_workers", _OPTIONS_CHECK_MAX_WORKERS)
+  use_bulk = kwargs.get("use_bulk", True)
 
   logging.info("Starting optionable tickers fetch using yfinance")
   logging.info(f"Rate limiting: {delay} seconds between requests")
@@ -217,36 +293,55 @@ def _get_optionable_tickers_impl(**kwargs: Any) -> list[Ticker]:
     logging.info(f"Limited to first {max_tickers} tickers for testing")
 
   logging.info(f"Checking {len(all_tickers)} tickers for options availability")
+  if not all_tickers:
+    return []
 
-  optionable_tickers = []
-  checked_count = 0
-
-  for ticker in all_tickers:
-    checked_count += 1
-
-    if checked_count % 100 == 0:
-      logging.info(
-        f"Progress: {checked_count}/{len(all_tickers)} tickers checked, {len(optionable_tickers)} optionable found"
-      )
-
-    try:
-      if _check_ticker_has_options(ticker.ticker):
-        # Create a new ticker object with optionable=True
-        optionable_ticker = ticker.model_copy()
-        optionable_ticker.optionable = True
-        optionable_tickers.append(optionable_ticker)
-        logging.debug(f"Found optionable ticker: {ticker.ticker}")
-
-    except Exception as e:
-      logging.warning(f"Error processing ticker {ticker.ticker}: {e}")
-      continue
+  has_options_by_symbol: dict[str, bool] = {}
+  if use_bulk:
+    quotes = _get_ticker_metadata_impl(
+      tickers=[ticker.ticker for ticker in all_tickers],
+      chunk_size=_QUOTE_CHUNK_SIZE,
+      delay=delay,
+    )
+    has_options_by_symbol = {
+      quote.ticker: quote.optionable for quote in quotes if quote.optionable is not None
+    }
+  # Symbols listed on several exchanges are only checked once.
+  to_check = list(
+    dict.fromkeys(
+      t.ticker for t in all_tickers if t.ticker not in has_options_by_symbol
+    )
+  )
 
-    # Rate limiting to avoid getting blocked
-    if checked_count < len(all_tickers):  # Don't sleep after the last request
-      time.sleep(delay)
+  if to_check:
+    logging.info(f"Checking {len(to_check)} tickers individually")
+
+    # Rate limiting to avoid getting blocked, shared by every worker.
+    limiter = TokenBucket(rate=1 / delay) if delay > 0 else None
+
+    def has_options(symbol: str) -> bool:
+      if limiter:
+        limiter.acquire()
+      return _check_ticker_has_options(symbol)
+
+    workers = max(1, min(max_workers, len(to_check)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+      results = executor.map(has_options, to_check)
+      for checked_count, (symbol, optionable) in enumerate(
+        zip(to_check, results, strict=True), start=1
+      ):
+        has_options_by_symbol[symbol] = optionable
+        if checked_count % 100 == 0:
+          logging.info(f"Progress: {checked_count}/{len(to_check)} tickers checked")
+
+  optionable_tickers = [
+    ticker.model_copy(update={"optionable": True})
+    for ticker in all_tickers
+    if has_options_by_symbol.get(ticker.ticker)
+  ]
 
   logging.info(
-    f"Completed optionable tickers scan: {len(optionable_tickers)} optionable tickers found out of {checked_count} checked"
+    f"Completed optionable tickers scan: {len(optionable_tickers)} optionable tickers found out of {len(all_tickers)} checked"
   )
   return optionable_tickers
 
@@ -291,32 +386,39 @@ def _get_ticker_metadata_impl(**kwargs: Any) -> list[Ticker]:
     delay,
   )
 
-  quote_url = f"{quote._QUERY1_URL_}/v7/finance/quote"
   data_client = _get_yf_data_client()
   metadata_map: dict[str, Ticker] = {}
 
-  chunks = _chunk_symbols(unique_tickers, chunk_size)
-  for index, chunk in enumerate(chunks, start=1):
+  # Chunks are requested concurrently; the shared bucket keeps request starts
+  # at least `delay` seconds apart, as the serial loop's sleep did.
+  limiter = TokenBucket(rate=1 / delay) if delay and delay > 0 else None
+
+  def fetch_chunk(chunk: list[str]) -> list[dict[str, Any]]:
+    if limiter:
+      limiter.acquire()
     params = {"symbols": ",".join(chunk)}
     try:
-      payload = data_client.get_raw_json(quote_url, params=params)
-      logging.debug("yfinance metadata payload: %s", json.dumps(payload, indent=2))
+      payload = data_client.get_raw_json(_QUOTE_URL, params=params)
+      # Only build the (large) pretty-printed dump when it will be emitted.
+      if logging.getLogger().isEnabledFor(logging.DEBUG):
+        logging.debug("yfinance metadata payload: %s", json.dumps(payload, indent=2))
     except Exception as exc:  # noqa: BLE001 - propagate log but continue
       logging.error("Failed to fetch yfinance metadata for chunk %s: %s", chunk, exc, exc_info=True)
-      continue
+      return []
 
     quotes = payload.get("quoteResponse", {}).get("result", [])
     if not quotes:
       logging.debug("yfinance metadata chunk %s returned no results", chunk)
-      continue
-
-    for raw_quote in quotes:
-      ticker_obj = _build_ticker_from_quote(raw_quote)
-      if ticker_obj:
-        metadata_map[ticker_obj.ticker] = ticker_obj
+    return quotes
 
-    if delay and index < len(chunks):
-      time.sleep(delay)
+  chunks = _chunk_symbols(unique_tickers, chunk_size)
+  workers = max(1, min(_METADATA_MAX_WORKERS, len(chunks)))
+  with ThreadPoolExecutor(max_workers=workers) as executor:
+    for quotes in executor.map(fetch_chunk, chunks):
+      for raw_quote in quotes:
+        ticker_obj = _build_ticker_from_quote(raw_quote)
+        if ticker_obj:
+          metadata_map[ticker_obj.ticker] = ticker_obj
 
   missing = [ticker for ticker in unique_tickers if ticker not in metadata_map]
   if missing:
@@ -330,63 +432,208 @@ def _get_ticker_metadata_impl(**kwargs: Any) -> list[Ticker]:
 
 # --- Candle Fetching Logic ---
 
+_INTERVAL_SUFFIXES = {
+  "minute": "m",
+  "hour": "h",
+  "day": "d",
+  "week": "wk",
+  "month": "mo",
+}
+
+_HISTORY_COLUMNS = {
+  "Open": "open",
+  "High": "high",
+  "Low": "low",
+  "Close": "close",
+  "Volume": "volume",
+}
+_CANDLE_DTYPES = {
+  "open": "float64",
+  "high": "float64",
+  "low": "float64",
+  "close": "float64",
+  "volume": "int64",
+  "timestamp": "int64",
+}
+
 
+@functools.cache
 def _map_to_yfinance_interval(timespan: str, multiplier: int) -> str:
-  span_map = {"minute": "m", "hour": "h", "day": "d", "week": "wk", "month": "mo"}
-  interval_char = span_map.get(timespan)
+  """Returns the yfinance interval string, e.g. ('day', 1) -> '1d'.
+
+  Memoized since batch fetches resolve the same interval for every ticker.
+  """
+  interval_char = _INTERVAL_SUFFIXES.get(timespan)
   if not interval_char:
     raise ValueError(f"Unsupported timespan for yfinance: '{timespan}'")
   return f"{multiplier}{interval_char}"
 
 
+def _index_to_epoch_ms(index: pd.DatetimeIndex) -> pd.Index:
+  """Converts a DatetimeIndex to epoch milliseconds in one vectorized step.
+
+  Naive indexes are treated as UTC.
+  """
+  import pandas as pd
+
+  if index.tz is None:
+    index = index.tz_localize("UTC")
+  return (index - pd.Timestamp(0, tz="UTC")) // pd.Timedelta(milliseconds=1)
+
+
+def _candle_arrays(df: pd.DataFrame) -> dict[str, list]:
+  """Flattens a yfinance history DataFrame into typed per-field columns.
+
+  Each Candle field becomes one list (float prices, int volume and epoch-ms
+  timestamp), converted as a whole vector so no pandas Series is built per
+  row. Rows with a missing or non-finite OHLCV value are dropped, and rows
+  with a fractional volume are logged and skipped.
+  """
+  columns = df[list(_HISTORY_COLUMNS)].rename(columns=_HISTORY_COLUMNS)
+  columns["timestamp"] = _index_to_epoch_ms(df.index)
+
+  # Yahoo pads missing bars with NaN (and occasionally inf). Drop them with one
+  # vectorized mask rather than letting each row fail validation on its own.
+  values = columns[list(_HISTORY_COLUMNS.values())].astype(float)
+  complete = (values.abs() < math.inf).all(axis=1)  # False for NaN and inf
+  if not complete.all():
+    logging.debug(f"Dropping {int((~complete).sum())} incomplete yfinance candles")
+    columns = columns[complete]
+
+  # The int cast below would silently truncate a fractional volume. Such rows
+  # fail Candle validation, so run them through it to log and skip them, as
+  # Polygon's converter does.
+  fractional = columns["volume"].astype(float) % 1 != 0
+  if fractional.any():
+    records = columns[fractional].to_dict("records")
+    Candle.validate_records(records, source="yfinance")
+    columns = columns[~fractional]
+
+  columns = columns.astype(_CANDLE_DTYPES)
+  return {name: columns[name].tolist() for name in _CANDLE_DTYPES}
+
+
+def _history_to_candles(df: pd.DataFrame) -> list[Candle]:
+  """Builds Candles from a history DataFrame.
+
+  The columns already carry Candle's field types after _candle_arrays, so
+  the models are constructed without re-validating every row.
+  """
+  arrays = _candle_arrays(df)
+  construct = Candle.model_construct
+  return [
+    construct(open=o, high=h, low=low, close=c, volume=v, timestamp=ts)
+    for o, h, low, c, v, ts in zip(*arrays.values(), strict=True)
+  ]
+
+
+@disk_cache(
+  "yfinance_candles",
+  Candle,
+  ttl=candles_ttl,
+  key_args=("ticker", "from_date", "to_date", "timespan", "multiplier"),
+)
 def _get_candles_impl(**kwargs: Any) -> list[Candle]:
   try:
     interval = _map_to_yfinance_interval(kwargs["timespan"], kwargs["multiplier"])
-    stock = yf.Ticker(kwargs["ticker"])
+    stock = _get_yf_ticker(kwargs["ticker"])
     df = stock.history(
       start=kwargs["from_date"], end=kwargs["to_date"], interval=interval
     )
     if df.empty:
       return []
 
-    valid_candles = []
-    for row in df.itertuples():
-      try:
-        candle_data = {
-          "open": row.Open,
-          "high": row.High,
-          "low": row.Low,
-          "close": row.Close,
-          "volume": row.Volume,
-          "timestamp": int(row.Index.timestamp() * 1000),
-        }
-        valid_candles.append(Candle.model_validate(candle_data))
-      except (ValidationError, AttributeError) as e:
-        logging.warning(
-          f"Skipping yfinance candle for {kwargs['ticker']} due to validation error: {e}"
-        )
-    return valid_candles
+    return _history_to_candles(df)
   except Exception as e:
     logging.error(f"Error with yfinance get_candles: {e}", exc_info=True)
     return []
 
 
+def _download_candles(symbols: list[str], **kwargs: Any) -> dict[str, list[Candle]]:
+  """Downloads history for several symbols with one threaded yf.download call."""
+  import yfinance as yf
+
+  interval = _map_to_yfinance_interval(kwargs["timespan"], kwargs["multiplier"])
+  df = yf.download(
+    tickers=symbols,
+    start=kwargs["from_date"],
+    end=kwargs["to_date"],
+    interval=interval,
+    group_by="ticker",
+    auto_adjust=True,  # Match Ticker.history's default.
+    threads=True,
+    progress=False,
+    session=_get_yf_session(),
+  )
+  if df is None or df.empty:
+    return {}
+
+  candles_by_symbol = {}
+  downloaded = set(df.columns.get_level_values(0))
+  for symbol in symbols:
+    if symbol not in downloaded:
+      continue
+    # The frame is aligned on the union of all symbols' dates, so drop the
+    # rows this symbol has no data for.
+    symbol_df = df[symbol].dropna(how="all")
+    if not symbol_df.empty:
+      candles_by_symbol[symbol] = _history_to_candles(symbol_df)
+  return candles_by_symbol
+
+
+def _get_candles_batch_impl(**kwargs: Any) -> dict[str, list[Candle]]:
+  """Fetches candles for `tickers`, downloading only those not already cached.
+
+  Results are read from and written to the same disk cache entries as the
+  single-ticker fetcher.
+  """
+  symbols = list(kwargs.pop("tickers"))
+  use_cache = kwargs.pop("cache", True)
+
+  results: dict[str, list[Candle]] = {}
+  if use_cache:
+    for symbol in symbols:
+      cached = _get_candles_impl.load(ticker=symbol, **kwargs)
+      if cached is not None:
+        results[symbol] = cached
+
+  missing = [symbol for symbol in symbols if symbol not in results]
+  if missing:
+    logging.info(
+      f"Downloading yfinance candles for {len(missing)} tickers in one batch"
+    )
+    try:
+      downloaded = _download_candles(missing, **kwargs)
+    except Exception as e:
+      logging.error(f"Error with yfinance batch get_candles: {e}", exc_info=True)
+      downloaded = {}
+    for symbol, candles in downloaded.items():
+      _get_candles_impl.store(candles, ticker=symbol, **kwargs)
+    results.update(downloaded)
+
+  return {symbol: results.get(symbol, []) for symbol in symbols}
+
+
 # --- Public Provider Class ---
 
 
 class YFinanceProvider:
-  def __init__(self):
-    self._capabilities = {
+  # The fetchers take no per-instance state, so every instance shares the map.
+  _capabilities = MappingProxyType(
+    {
       TickersFetcher: _get_tickers_impl,
       CandlesFetcher: _get_candles_impl,
+      BatchCandlesFetcher: _get_candles_batch_impl,
       OptionableFetcher: _get_optionable_tickers_impl,
       MetadataFetcher: _get_ticker_metadata_impl,
     }
+  )
 
   def supports(self, interface_class: type) -> bool:
     return interface_class in self._capabilities
 
   def get_fetcher(self, interface_class: type):
-    if not self.supports(interface_class):
+    fetcher = self._capabilities.get(interface_class)
+    if fetcher is None:
       raise TypeError(f"This provider does not support {interface_class.__name__}")
-    return self._capabilities[interface_class]
\ No newline at end of file
+    return fetcher
@@ -0,0 +1,320 @@
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Mapping
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+from market_data.models import _Record
+
+CACHE_DIR_ENV_VAR = "MARKET_DATA_CACHE_DIR"
+_DEFAULT_CACHE_DIR = Path.home() / ".cache" / "market_data"
+
+# --- TTL Policies (seconds; None means the entry never expires) ---
+TICKERS_TTL_SECONDS = 24 * 60 * 60
+RECENT_CANDLES_TTL_SECONDS = 60 * 60
+CLOSED_CANDLES_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+def candles_ttl(kwargs: dict[str, Any]) -> float | None:
+  """TTL policy for candle requests.
+
+  Bars for a range that closed before today don't change, but providers
+  return split- and dividend-adjusted prices that a later corporate action
+  rewrites, so they are refreshed weekly. Ranges reaching today can still
+  change and expire after an hour.
+  """
+  to_date = kwargs.get("to_date")
+  try:
+    if to_date and date.fromisoformat(str(to_date)) < date.today():
+      return CLOSED_CANDLES_TTL_SECONDS
+  except ValueError:
+    pass
+  return RECENT_CANDLES_TTL_SECONDS
+
+
+def get_cache_dir() -> Path:
+  """Returns the cache root, honouring the MARKET_DATA_CACHE_DIR env var."""
+  return Path(os.getenv(CACHE_DIR_ENV_VAR) or _DEFAULT_CACHE_DIR).expanduser()
+
+
+def _cache_path(namespace: str, key_kwargs: dict[str, Any]) -> Path:
+  key = json.dumps(key_kwargs, sort_keys=True, default=str)
+  digest = hashlib.sha1(f"{namespace}:{key}".encode()).hexdigest()
+  return get_cache_dir() / namespace / f"{digest}.json"
+
+
+def _load_entry(path: Path) -> dict[str, Any] | None:
+  try:
+    with path.open(encoding="utf-8") as f:
+      return json.load(f)
+  except FileNotFoundError:
+    return None
+  except (OSError, ValueError) as e:
+    logging.warning(f"Ignoring unreadable cache entry {path}: {e}")
+    return None
+
+
+def _is_expired(created_at: float, ttl: float | None) -> bool:
+  return ttl is not None and time.time() - created_at > ttl
+
+
+def _read_entry(path: Path, ttl: float | None) -> list[dict[str, Any]] | None:
+  entry = _load_entry(path)
+  if entry is None or _is_expired(entry.get("created_at", 0), ttl):
+    return None
+  return entry.get("records")
+
+
+def _write_entry(path: Path, records: list[dict[str, Any]]) -> float:
+  """Writes an entry atomically and returns its creation time."""
+  created_at = time.time()
+  try:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write to a temp file first so concurrent readers never see a partial entry.
+    with tempfile.NamedTemporaryFile(
+      "w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False
+    ) as f:
+      json.dump({"created_at": created_at, "records": records}, f)
+    os.replace(f.name, path)
+  except OSError as e:
+    logging.warning(f"Failed to write cache entry {path}: {e}")
+  return created_at
+
+
+class _MemoryCache:
+  """A small thread-safe LRU of decoded entries: path -> (created_at, models).
+
+  Sits in front of the JSON files so a process that repeats a request (e.g.
+  the ticker list behind both the metadata and optionable commands) reuses
+  the models instead of re-reading and re-building them.
+  """
+
+  def __init__(self, maxsize: int):
+    self._maxsize = maxsize
+    self._entries: OrderedDict[Path, tuple[float, list[_Record]]] = OrderedDict()
+    self._lock = threading.Lock()
+
+  def get(self, path: Path, ttl: float | None) -> list[_Record] | None:
+    with self._lock:
+      hit = self._entries.get(path)
+      if hit is None:
+        return None
+      if _is_expired(hit[0], ttl):
+        del self._entries[path]
+        return None
+      self._entries.move_to_end(path)
+    # Hand out a copy so callers can't reorder or truncate the cached list.
+    return list(hit[1])
+
+  def put(self, path: Path, created_at: float, result: list[_Record]) -> None:
+    with self._lock:
+      self._entries[path] = (created_at, list(result))
+      self._entries.move_to_end(path)
+      while len(self._entries) > self._maxsize:
+        self._entries.popitem(last=False)
+
+
+def disk_cache(
+  namespace: str,
+  model: type[_Record],
+  ttl: float | Callable[[dict[str, Any]], float | None] | None,
+  key_args: tuple[str, ...] = (),
+  memory_maxsize: int = 128,
+) -> Callable:
+  """Caches a fetcher's list of models on disk, keyed by selected kwargs.
+
+  Only the kwargs named in `key_args` form the cache key, so clients and API
+  keys bound into the fetcher never leak into the key. Empty results are not
+  cached since fetchers return [] on errors. Callers can pass `cache=False`
+  to bypass the cache and force a refresh.
+
+  The most recently used entries are also kept in memory, under the same
+  TTL, so repeated requests within a process skip the file entirely.
+
+  The wrapper also exposes `load(**kwargs)` and `store(result, **kwargs)` so
+  batch fetchers can share entries with the single-request fetcher.
+
+  Args:
+    namespace: Cache sub-directory, e.g. 'polygon_tickers'
+    model: Model type of the list elements
+    ttl: Seconds until expiry, None for never, or a callable computing the
+      TTL from the call's kwargs
+    key_args: Names of the kwargs that identify a distinct request
+    memory_maxsize: Number of entries kept decoded in memory
+
+  Returns:
+    Decorator wrapping a `(**kwargs) -> list[model]` fetcher
+  """
+  memory = _MemoryCache(memory_maxsize)
+
+  def _path(kwargs: dict[str, Any]) -> Path:
+    return _cache_path(namespace, {name: kwargs.get(name) for name in key_args})
+
+  def load(**kwargs: Any) -> list[_Record] | None:
+    path = _path(kwargs)
+    entry_ttl = ttl(kwargs) if callable(ttl) else ttl
+    cached = memory.get(path, entry_ttl)
+    if cached is not None:
+      return cached
+
+    entry = _load_entry(path)
+    if entry is None or _is_expired(entry.get("created_at", 0), entry_ttl):
+      return None
+    records = entry.get("records")
+    if records is None:
+      return None
+    logging.info(f"Loaded {len(records)} {namespace} records from cache {path}")
+    # Entries are written from validated models, so skip re-validation.
+    result = model.from_records(records)
+    memory.put(path, entry.get("created_at", 0), result)
+    return result
+
+  def store(result: list[_Record], **kwargs: Any) -> None:
+    if result:
+      path = _path(kwargs)
+      records = [item.model_dump(by_alias=True) for item in result]
+      memory.put(path, _write_entry(path, records), result)
+
+  def decorator(func: Callable[..., list[_Record]]) -> Callable:
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> list[_Record]:
+      if kwargs.pop("cache", True):
+        cached = load(**kwargs)
+        if cached is not None:
+          return cached
+
+      result = func(*args, **kwargs)
+      store(result, **kwargs)
+      return result
+
+    wrapper.load = load
+    wrapper.store = store
+    return wrapper
+
+  return decorator
+
+
+class PageCheckpoint:
+  """Persists the pages of a paginated download so an interrupted run can resume.
+
+  Each completed page is written to its own entry together with the cursor of
+  the next page. If the download fails part-way, the next run with the same
+  key reloads the saved pages and continues from the cursor instead of
+  starting over. Checkpoints older than `ttl` are ignored.
+
+  Example:
+    >>> checkpoint = PageCheckpoint("polygon_tickers_pages", {"market": "stocks"})
+    >>> saved = checkpoint.load()  # None, or (pages, next_cursor)
+  """
+
+  def __init__(
+    self,
+    namespace: str,
+    key_kwargs: dict[str, Any],
+    ttl: float | None = TICKERS_TTL_SECONDS,
+  ):
+    self._dir = _cache_path(namespace, key_kwargs).with_suffix("")
+    self._ttl = ttl
+
+  def _page_path(self, page_number: int) -> Path:
+    return self._dir / f"page_{page_number:05d}.json"
+
+  def load(self) -> tuple[list[list[dict[str, Any]]], str | None] | None:
+    """Returns the saved pages and the next cursor, or None to start afresh."""
+    state = _read_entry(self._dir / "cursor.json", self._ttl)
+    if not state:
+      return None
+
+    pages = []
+    for page_number in range(state[0]["pages"]):
+      page = _read_entry(self._page_path(page_number), None)
+      if page is None:
+        logging.warning(f"Discarding incomplete checkpoint {self._dir}")
+        return None
+      pages.append(page)
+    return pages, state[0]["next_cursor"]
+
+  def save(
+    self, page_number: int, records: list[dict[str, Any]], next_cursor: str | None
+  ) -> None:
+    """Stores a completed page, then advances the cursor past it."""
+    _write_entry(self._page_path(page_number), records)
+    _write_entry(
+      self._dir / "cursor.json",
+      [{"pages": page_number + 1, "next_cursor": next_cursor}],
+    )
+
+  def clear(self) -> None:
+    """Removes the checkpoint once the download has completed."""
+    shutil.rmtree(self._dir, ignore_errors=True)
+
+
+class ConditionalCache:
+  """Keeps a downloaded file's parsed models together with its HTTP validators.
+
+  Lets a fetcher revalidate a large, rarely changing download with a
+  conditional GET: `request_headers()` yields If-None-Match/If-Modified-Since
+  from the last response, and on a 304 reply `load()` returns the models parsed
+  from that response without downloading or parsing the body again. Entries
+  never expire; the server decides whether they are still current.
+
+  Example:
+    >>> conditional = ConditionalCache("sec_company_tickers", Ticker)
+    >>> response = session.get(url, headers=conditional.request_headers())
+  """
+
+  def __init__(self, namespace: str, model: type[_Record]):
+    self._path = _cache_path(namespace, {})
+    self._model = model
+    self._entry: dict[str, Any] | None = None
+    self._loaded = False
+
+  def _read(self) -> dict[str, Any] | None:
+    if not self._loaded:
+      records = _read_entry(self._path, None)
+      self._entry = records[0] if records else None
+      self._loaded = True
+    return self._entry
+
+  def request_headers(self) -> dict[str, str]:
+    """Returns the conditional request headers, or {} if nothing is stored."""
+    entry = self._read()
+    if not entry:
+      return {}
+
+    headers = {}
+    if entry.get("etag"):
+      headers["If-None-Match"] = entry["etag"]
+    if entry.get("last_modified"):
+      headers["If-Modified-Since"] = entry["last_modified"]
+    return headers
+
+  def load(self) -> list[_Record] | None:
+    """Returns the models stored with the validators, or None if absent."""
+    entry = self._read()
+    if entry is None:
+      return None
+    logging.info(f"Reusing {len(entry['items'])} unchanged records from {self._path}")
+    return self._model.from_records(entry["items"])
+
+  def store(self, response_headers: Mapping[str, str], result: list[_Record]) -> None:
+    """Stores the models parsed from a response along with its validators."""
+    etag = response_headers.get("ETag")
+    last_modified = response_headers.get("Last-Modified")
+    if not result or not (etag or last_modified):
+      return
+    items = [item.model_dump(by_alias=True) for item in result]
+    _write_entry(
+      self._path, [{"etag": etag, "last_modified": last_modified, "items": items}]
+    )
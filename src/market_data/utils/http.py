@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def make_retry(total_retries: int = 5, backoff_factor: float = 1.0) -> Retry:
+  """Builds the urllib3 retry policy shared by every HTTP client in the project.
+
+  Connection errors and 429/5xx responses are retried with exponential backoff,
+  and a server-provided Retry-After header is honoured.
+
+  Args:
+    total_retries: Maximum number of retry attempts per request
+    backoff_factor: Base of the exponential backoff, in seconds
+
+  Returns:
+    Retry: The retry policy, usable by requests adapters and urllib3 pools
+  """
+  return Retry(
+    total=total_retries,
+    backoff_factor=backoff_factor,
+    status_forcelist=_RETRY_STATUS_CODES,
+    respect_retry_after_header=True,
+  )
+
+
+def make_session(
+  headers: dict[str, str] | None = None,
+  total_retries: int = 5,
+  backoff_factor: float = 1.0,
+  pool_maxsize: int = 16,
+) -> requests.Session:
+  """Creates a requests.Session that retries transient HTTP failures.
+
+  Connection errors and 429/5xx responses are retried with exponential backoff,
+  and a server-provided Retry-After header is honoured. Keep-alive connections
+  are pooled per host, so share one session per module rather than calling
+  requests.get.
+
+  Args:
+    headers: Default headers to send with every request (e.g., User-Agent)
+    total_retries: Maximum number of retry attempts per request
+    backoff_factor: Base of the exponential backoff, in seconds
+    pool_maxsize: Connections kept alive per host; size it to the number of
+      threads that may use the session concurrently
+
+  Returns:
+    requests.Session: Session with the retrying adapter mounted for http(s)
+  """
+  retry = make_retry(total_retries, backoff_factor)
+  adapter = HTTPAdapter(max_retries=retry, pool_maxsize=pool_maxsize)
+
+  session = requests.Session()
+  session.mount("https://", adapter)
+  session.mount("http://", adapter)
+  if headers:
+    session.headers.update(headers)
+  return session
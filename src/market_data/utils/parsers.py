@@ -1,6 +1,11 @@
 from __future__ import annotations
 
-import pandas as pd
+import functools
+import importlib.util
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+  import pandas as pd
 
 _SAFE_NA_VALUES = [
   "",  # Empty string
@@ -10,6 +15,16 @@ _SAFE_NA_VALUES = [
 ]
 
 
+@functools.cache
+def _csv_engine() -> str:
+  """Picks pyarrow's multithreaded C++ reader when installed; same results.
+
+  Only the package's presence is checked, so pyarrow (an optional speed-up)
+  is imported by pandas when a CSV is actually parsed.
+  """
+  return "pyarrow" if importlib.util.find_spec("pyarrow") else "c"
+
+
 def read_csv_with_conventions(
   filepath_or_buffer, strip_whitespace: bool = True, **kwargs
 ) -> pd.DataFrame:
@@ -19,11 +34,13 @@ def read_csv_with_conventions(
   - Disables default "NA" string interpretation to correctly handle ticker symbols like "NA"
   - Strips whitespace from column names and cell values by default
   - Uses a conservative set of NA values to avoid false positives
+  - Parses with the pyarrow engine when pyarrow is installed
 
   Args:
     filepath_or_buffer: File path, URL, or buffer object to read
     strip_whitespace: If True, strips leading/trailing whitespace from column names and string values
-    **kwargs: Additional arguments passed to pd.read_csv
+    **kwargs: Additional arguments passed to pd.read_csv (pass engine= to
+      override the parser engine)
 
   Returns:
     pd.DataFrame: Parsed DataFrame with applied conventions
@@ -32,19 +49,60 @@ def read_csv_with_conventions(
     >>> df = read_csv_with_conventions('tickers.csv')
     >>> # Ticker symbol 'NA' will be preserved, not treated as NaN
   """
+  import pandas as pd
+
   df = pd.read_csv(
     filepath_or_buffer,
     keep_default_na=False,
     na_values=kwargs.pop("na_values", _SAFE_NA_VALUES),
+    engine=kwargs.pop("engine", None) or _csv_engine(),
     **kwargs,
   )
 
   if strip_whitespace:
     # Strip whitespace from column names
-    df.columns = df.columns.str.strip()
+    df.columns = [c.strip() if isinstance(c, str) else c for c in df.columns]
 
-    # Strip whitespace from string columns
-    for col in df.select_dtypes(include=["object"]).columns:
-      df[col] = df[col].astype(str).str.strip()
+    # Strip whitespace from string columns. Arrow-backed string columns are
+    # stripped natively; object columns are faster as a plain comprehension,
+    # which also leaves missing cells as NaN instead of the string "nan".
+    for col, dtype in df.dtypes.items():
+      if isinstance(dtype, pd.StringDtype):
+        df[col] = df[col].str.strip()
+      elif pd.api.types.is_object_dtype(dtype):
+        values = df[col].to_numpy()
+        df[col] = [v.strip() if isinstance(v, str) else v for v in values]
 
   return df
+
+
+def split_delimited_with_conventions(
+  text: str, sep: str
+) -> tuple[list[str], list[list[str | None]]]:
+  """Splits simple delimited text (no quoting) using the same conventions.
+
+  A lightweight alternative to read_csv_with_conventions for small, fixed-schema
+  files such as the pipe-delimited nasdaqtrader symbol directories, where a
+  DataFrame isn't needed. Cells are whitespace-stripped and the safe NA values
+  become None; "NA" is kept as a ticker symbol.
+
+  Args:
+    text: The decoded file contents, starting with a header line
+    sep: Field delimiter, e.g. '|'
+
+  Returns:
+    tuple: (column names, rows of cell values)
+  """
+  lines = text.splitlines()
+  if not lines:
+    return [], []
+
+  na_values = frozenset(_SAFE_NA_VALUES)
+  header = [column.strip() for column in lines[0].split(sep)]
+  rows = []
+  for line in lines[1:]:
+    if not line:
+      continue
+    cells = (cell.strip() for cell in line.split(sep))
+    rows.append([None if cell in na_values else cell for cell in cells])
+  return header, rows
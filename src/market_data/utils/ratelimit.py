@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import threading
+import time
+
+
+class TokenBucket:
+  """A thread-safe token-bucket rate limiter.
+
+  Tokens refill continuously at `rate` tokens per second up to `capacity`.
+  Each `acquire()` consumes one token, blocking only when the bucket is empty,
+  so bursts up to `capacity` proceed immediately and sustained throughput is
+  capped at `rate`.
+
+  Example:
+    >>> bucket = TokenBucket(rate=5 / 60, capacity=5)  # 5 requests per minute
+    >>> bucket.acquire()
+  """
+
+  def __init__(self, rate: float, capacity: float = 1.0):
+    if rate <= 0:
+      raise ValueError("TokenBucket rate must be positive.")
+    if capacity < 1:
+      raise ValueError("TokenBucket capacity must be at least 1.")
+
+    self.rate = rate
+    self.capacity = capacity
+    self._tokens = capacity
+    self._updated_at = time.monotonic()
+    self._lock = threading.Lock()
+
+  def _refill(self) -> None:
+    now = time.monotonic()
+    self._tokens = min(
+      self.capacity, self._tokens + (now - self._updated_at) * self.rate
+    )
+    self._updated_at = now
+
+  def acquire(self) -> float:
+    """Blocks until a token is available and consumes it.
+
+    Returns:
+      The number of seconds spent waiting.
+    """
+    waited = 0.0
+    while True:
+      with self._lock:
+        self._refill()
+        if self._tokens >= 1:
+          self._tokens -= 1
+          return waited
+        wait_for = (1 - self._tokens) / self.rate
+
+      time.sleep(wait_for)
+      waited += wait_for
@@ -1,23 +1,108 @@
+from __future__ import annotations
+
+import csv
 import logging
+import operator
+from collections.abc import Iterable, Sequence
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import pandas as pd
+if TYPE_CHECKING:
+  from pydantic import BaseModel
 
 OUTPUT_DIR = Path("csv")
 
 
-def save_to_csv(data: list[dict[str, Any]], filename: str) -> None:
-  """Writes a list of dictionaries to a CSV file."""
-  if not data:
+def save_models_to_csv(models: Sequence[BaseModel], filename: str) -> None:
+  """Writes a list of flat Pydantic models (e.g. Ticker, Candle) to a CSV file.
+
+  The header comes from the model's fields and each row is emitted as the
+  tuple returned by a single attrgetter call, so no per-row dicts, pydantic
+  serialization or DataFrame are built along the way.
+  """
+  if not models:
+    logging.warning("No data provided to write to CSV.")
+    return
+
+  fields = tuple(type(models[0]).model_fields)
+  to_row = operator.attrgetter(*fields)
+  if len(fields) == 1:
+    rows = ((to_row(model),) for model in models)
+  else:
+    rows = (to_row(model) for model in models)
+
+  output_path = OUTPUT_DIR / filename
+  try:
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    with output_path.open("w", newline="", encoding="utf-8") as f:
+      writer = csv.writer(f, lineterminator="\n")
+      writer.writerow(fields)
+      writer.writerows(rows)
+    logging.info(f"Data successfully written to {output_path}")
+  except (OSError, PermissionError) as e:
+    # Catch specific file system errors.
+    logging.error(f"A file system error occurred while writing to {output_path}: {e}")
+  except Exception as e:
+    # Catch any other unexpected errors.
+    logging.error(f"An unexpected error occurred while writing to {output_path}: {e}")
+
+
+def save_models_to_parquet(models: Sequence[BaseModel], filename: str) -> None:
+  """Writes a list of flat Pydantic models to a Zstandard-compressed Parquet file.
+
+  Columns are gathered straight from the model attributes and written with
+  dictionary encoding, which suits repetitive fields such as exchange, market
+  and currency. Requires pyarrow (the `fast` extra).
+  """
+  if not models:
+    logging.warning("No data provided to write to Parquet.")
+    return
+
+  try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+  except ImportError:
+    logging.error('Parquet output requires pyarrow: pip install "market-data[fast]"')
+    return
+
+  fields = tuple(type(models[0]).model_fields)
+  table = pa.table(
+    {field: [getattr(model, field) for model in models] for field in fields}
+  )
+
+  output_path = OUTPUT_DIR / filename
+  try:
+    OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+    pq.write_table(table, output_path, compression="zstd", use_dictionary=True)
+    logging.info(f"Data successfully written to {output_path}")
+  except (OSError, PermissionError) as e:
+    # Catch specific file system errors.
+    logging.error(f"A file system error occurred while writing to {output_path}: {e}")
+  except Exception as e:
+    # Catch any other unexpected errors.
+    logging.error(f"An unexpected error occurred while writing to {output_path}: {e}")
+
+
+def save_to_csv(data: Iterable[dict[str, Any]], filename: str) -> None:
+  """Streams dictionaries to a CSV file.
+
+  Rows are written as they are produced, so callers can pass a generator.
+  The header is taken from the first row's keys, which every row must share.
+  """
+  rows = iter(data)
+  first_row = next(rows, None)
+  if first_row is None:
     logging.warning("No data provided to write to CSV.")
     return
 
   output_path = OUTPUT_DIR / filename
   try:
     OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
-    df = pd.DataFrame(data)
-    df.to_csv(output_path, index=False, encoding="utf-8")
+    with output_path.open("w", newline="", encoding="utf-8") as f:
+      writer = csv.DictWriter(f, fieldnames=list(first_row), lineterminator="\n")
+      writer.writeheader()
+      writer.writerow(first_row)
+      writer.writerows(rows)
     logging.info(f"Data successfully written to {output_path}")
   except (OSError, PermissionError) as e:
     # Catch specific file system errors.